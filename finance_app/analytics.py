@@ -0,0 +1,74 @@
+"""Satır düzeyinde analiz gereken durumlar için vektörel pandas hesaplamaları.
+
+Aylık özet tablosunun karşılayamadığı sorgular (keyfi tarih aralıkları,
+günlük seriler) burada bir kez yüklenen, sütun bazlı bir DataFrame üzerinden
+hesaplanır. Tarihler satır satır değil, tek geçişte dönüştürülür.
+"""
+import pandas as pd
+
+# date.fromordinal(719163) == 1970-01-01
+UNIX_EPOCH_ORDINAL = 719163
+
+FRAME_COLUMNS = ["id", "type", "category", "date_ord", "amount_minor", "date"]
+
+
+def parse_dates(date_ord, date_text):
+    """Gün numaralarını datetime64'e çevirir; eksik olanları metinden errors='coerce' ile okur."""
+    ordinals = pd.to_numeric(date_ord, errors="coerce")
+    missing = ordinals.isna()
+    days = (ordinals.fillna(UNIX_EPOCH_ORDINAL).astype("int64") - UNIX_EPOCH_ORDINAL).to_numpy()
+    dates = pd.Series(days.astype("datetime64[D]").astype("datetime64[ns]"), index=date_ord.index)
+    if missing.any():
+        dates[missing] = pd.to_datetime(date_text[missing].str[:10], format="%Y-%m-%d", errors="coerce")
+    return dates
+
+
+def load_frame(db, **filters):
+    """Filtrelenmiş işlemleri sütun bazlı tek sorguyla DataFrame olarak yükler."""
+    conditions, params = db.transaction_filters(**filters)
+    query = f"SELECT {', '.join(FRAME_COLUMNS)} FROM transactions"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    frame = pd.read_sql_query(query, db.conn, params=params)
+    frame["type"] = frame["type"].astype("category")
+    frame["category"] = frame["category"].astype("category")
+    frame["date"] = parse_dates(frame["date_ord"], frame["date"])
+    frame = frame.dropna(subset=["date"])
+    frame["amount_minor"] = frame["amount_minor"].astype("int64")
+    frame["amount"] = frame["amount_minor"] / 100.0
+    frame["period"] = frame["date"].dt.to_period("M")
+    return frame.drop(columns=["date_ord"])
+
+
+def monthly_summary(frame):
+    """FinanceManager.generate_summary ile aynı biçimde ay × tür tablosu döndürür."""
+    if frame.empty:
+        return pd.DataFrame(columns=["Gelir", "Gider"])
+    minor = frame.groupby(["period", "type"], observed=True)["amount_minor"].sum().unstack(fill_value=0)
+    summary = minor / 100.0
+    summary.index.name = "month"
+    summary.columns = summary.columns.astype(str)
+    summary.columns.name = "type"
+    return summary
+
+
+def budget_report(frame, budgets):
+    """(dönem, bütçe, gider, kalan) listesi; `budgets` {"YYYY-MM": tutar} sözlüğüdür."""
+    expenses = frame[frame["type"] == "Gider"]
+    if expenses.empty:
+        return []
+    minor = expenses.groupby("period")["amount_minor"].sum()
+    report = []
+    for period, expense_minor in minor.items():
+        budget_minor = int(round(budgets.get(str(period), 0.0) * 100))
+        report.append((str(period), budget_minor / 100.0, expense_minor / 100.0,
+                       (budget_minor - int(expense_minor)) / 100.0))
+    return report
+
+
+def category_totals(frame, type=None):
+    """(kategori, toplam) listesini kategori adına göre sıralı döndürür."""
+    if type:
+        frame = frame[frame["type"] == type]
+    minor = frame.groupby("category", observed=True)["amount_minor"].sum().sort_index()
+    return [(str(category), total / 100.0) for category, total in minor.items()]
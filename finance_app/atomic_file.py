@@ -0,0 +1,42 @@
+"""Dosyaları yarım kalmadan yazmak için ortak yardımcı.
+
+Çıktı hedefle aynı dizindeki geçici bir dosyaya yazılır ve ancak başarıyla
+kapandıktan sonra os.replace ile tek adımda yerine taşınır; hata olursa
+hedef dosyaya dokunulmaz.
+"""
+import contextlib
+import os
+import stat
+import tempfile
+
+# mkstemp dosyayı 0600 ile açar; yeni dosyalar open() ile oluşturulmuş gibi umask'a uymalı.
+# umask yalnızca değiştirilerek okunabildiğinden iş parçacıkları başlamadan bir kez okunur.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path):
+    """Var olan hedefin izinlerini, yoksa 0666 & ~umask değerini döndürür."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextlib.contextmanager
+def atomic_output(path, mode="w", prefix=".tmp_", **kwargs):
+    """Hedefle aynı dizinde geçici dosya açar; blok başarıyla biterse yerine taşır.
+
+    Taşınan dosya hedefin mevcut izinlerini (yoksa umask'a göre varsayılanı) alır.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.chmod(temp_path, _target_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,7 @@
+"""Performans ölçüm betikleri.
+
+finance_app dizininden çalıştırılır, örneğin:
+    python -m benchmarks.sqlite_profiles
+    python -m benchmarks.generator fixture.db --rows 1000000
+    python -m benchmarks.operations --fixture fixture.db --output sonuc.json
+"""
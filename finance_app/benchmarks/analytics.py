@@ -0,0 +1,74 @@
+"""Satır satır tarih ayrıştırmayı vektörel analiz motoruyla karşılaştırır.
+
+Her boyut için geçici bir veritabanı üretilir ve aynı aylık özet üç yolla
+hesaplanır: eski satır bazlı `apply(pd.to_datetime)`, analytics.load_frame
+ile vektörel yükleme ve aylık özet tablosu üzerinden SQL.
+
+    python -m benchmarks.analytics --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import pandas as pd
+import analytics
+from finance_manager import FinanceManager
+from benchmarks.generator import build_database
+
+
+def legacy_summary(db):
+    """Eski generate_summary: demetlerden DataFrame ve satır başına pd.to_datetime."""
+    df = pd.DataFrame(db.get_transactions(), columns=["id", "type", "amount", "category", "date", "description"])
+
+    def parse_date(date_str):
+        try:
+            return pd.to_datetime(date_str, format="%Y-%m-%d")
+        except ValueError:
+            return pd.NaT
+
+    df["date"] = df["date"].apply(parse_date)
+    df = df.dropna(subset=["date"])
+    df["month"] = df["date"].dt.to_period("M")
+    return df.groupby(["month", "type"])["amount"].sum().unstack().fillna(0)
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return round(time.perf_counter() - started, 4)
+
+
+def run_size(rows, legacy_limit):
+    workdir = tempfile.mkdtemp(prefix="finance_bench_")
+    try:
+        db = build_database(os.path.join(workdir, "finance.db"), rows)
+        finance_manager = FinanceManager(db)
+        result = {"rows": rows}
+        result["legacy_rowwise_seconds"] = timed(lambda: legacy_summary(db)) if rows <= legacy_limit else None
+        result["vectorized_load_seconds"] = timed(lambda: analytics.load_frame(db))
+        frame = analytics.load_frame(db)
+        result["vectorized_summary_seconds"] = timed(lambda: analytics.monthly_summary(frame))
+        result["vectorized_report_seconds"] = timed(lambda: analytics.budget_report(frame, db.get_budgets()))
+        result["vectorized_chart_seconds"] = timed(lambda: analytics.category_totals(frame, "Gider"))
+        result["rollup_summary_seconds"] = timed(lambda: finance_manager.generate_summary())
+        db.close()
+        return result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz motoru karşılaştırması")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10000, 100000, 1000000])
+    parser.add_argument("--legacy-limit", type=int, default=100000,
+                        help="Bu satır sayısının üzerinde eski satır bazlı yol ölçülmez")
+    args = parser.parse_args(argv)
+    results = [run_size(rows, args.legacy_limit) for rows in args.sizes]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""Ölçümler için belirlenimci (aynı tohum → aynı veri) sentetik işlem üreticisi.
+
+Satırlar parça parça üretilip eklenir; 10 milyon satırlık bir veritabanı da
+bellekte tutulmadan oluşturulur.
+
+    python -m benchmarks.generator fixture.db --rows 1000000 --years 5 --skew 1.2
+"""
+import argparse
+import os
+import random
+import time
+from database import Database
+
+CATEGORIES = [
+    "Yiyecek", "Faturalar", "Ulaşım", "Alışveriş", "Kira", "Eğlence", "Sağlık",
+    "Eğitim", "Kişisel Bakım", "Ev Bakımı", "Kredi Kartı", "Borç", "Diğer", "Maaş", "Yatırım"
+]
+INCOME_CATEGORIES = {"Maaş", "Yatırım"}
+DESCRIPTION_WORDS = [
+    "market", "fatura", "elektrik", "su", "doğalgaz", "internet", "otobüs", "taksi", "benzin",
+    "kira", "maaş", "prim", "kafe", "restoran", "sinema", "eczane", "kitap", "kurs", "giyim", "tamir"
+]
+
+
+def category_weights(categories, skew):
+    """Zipf benzeri ağırlıklar: skew=0 eşit dağılım, büyüdükçe ilk kategoriler baskınlaşır."""
+    return [1.0 / (rank ** skew) for rank in range(1, len(categories) + 1)]
+
+
+def generate_rows(rows, years=5, categories=None, skew=1.0, seed=42, end_year=2025):
+    """(type, amount, category, date, description) satırlarını sırayla üretir."""
+    rng = random.Random(seed)
+    categories = list(categories or CATEGORIES)
+    weights = category_weights(categories, skew)
+    first_year = end_year - years + 1
+    # Kategori seçimi tek tek yapılmaz; her parça için toplu çekilir
+    batch = 10000
+    produced = 0
+    while produced < rows:
+        size = min(batch, rows - produced)
+        picked = rng.choices(categories, weights=weights, k=size)
+        for category in picked:
+            type_ = "Gelir" if category in INCOME_CATEGORIES else "Gider"
+            amount = round(rng.lognormvariate(5.5 if type_ == "Gider" else 9.0, 1.0), 2)
+            date = f"{rng.randint(first_year, end_year)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            description = f"{rng.choice(DESCRIPTION_WORDS)} {rng.randint(1, 9999)}"
+            yield type_, amount, category, date, description
+        produced += size
+
+
+def build_database(path, rows, years=5, categories=None, skew=1.0, seed=42, profile="performance",
+                   chunk_size=50000):
+    """`path` konumunda üretilmiş satırlarla dolu bir veritabanı oluşturur ve açık döndürür."""
+    db = Database(path, profile=profile)
+    db.add_categories(categories or CATEGORIES, commit=False)
+    chunk = []
+    for row in generate_rows(rows, years, categories, skew, seed):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            db.add_transactions(chunk, commit=False)
+            chunk = []
+    db.add_transactions(chunk)
+    return db
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik finance.db üretir")
+    parser.add_argument("path", help="Oluşturulacak veritabanı dosyası")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--categories", type=int, default=len(CATEGORIES),
+                        help=f"Kullanılacak kategori sayısı (en fazla {len(CATEGORIES)})")
+    parser.add_argument("--skew", type=float, default=1.0, help="Kategori dağılımının çarpıklığı (0 = eşit)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.path):
+        parser.error(f"{args.path} zaten var")
+    started = time.perf_counter()
+    db = build_database(args.path, args.rows, args.years, CATEGORIES[:args.categories], args.skew, args.seed)
+    db.close()
+    print(f"{args.rows} satır {time.perf_counter() - started:.2f} sn içinde {args.path} dosyasına yazıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+"""FinanceManager işlemlerinin sürelerini sentetik veri üzerinde ölçer.
+
+Ekleme, filtreleme, arama, özet, rapor, grafik ve silme yolları ölçülür;
+sonuçlar JSON olarak yazılır ve önceki bir çalıştırmayla karşılaştırılabilir.
+Her ölçümden önce sorgu önbelleği boşaltılır, böylece önbellek isabetleri
+sonuçları çarpıtmaz.
+
+    python -m benchmarks.operations --rows 100000 --output sonuc.json
+    python -m benchmarks.operations --fixture fixture.db --compare sonuc.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from database import CONNECTION_PROFILES, Database
+from finance_manager import FinanceManager
+from benchmarks.generator import CATEGORIES, DESCRIPTION_WORDS, build_database, generate_rows
+
+
+def _random_period(rng, years):
+    return str(rng.choice(years)), f"{rng.randint(1, 12):02d}"
+
+
+def operations(fm, rng, years, categories):
+    """(ad, tek ölçümlük iş) çiftlerini döndürür; her iş bir kez çalıştırılacak bir fonksiyondur."""
+    def insert_single():
+        type_, amount, category, date, description = next(generate_rows(1, seed=rng.random()))
+        fm.add_transaction(type_, amount, category, date, description)
+
+    def insert_batch():
+        fm.import_transactions(generate_rows(1000, seed=rng.random()))
+
+    def filter_page():
+        year, month = _random_period(rng, years)
+        fm.get_transactions_page(limit=500, with_total=True, year=year, month=month)
+
+    def filter_month():
+        year, month = _random_period(rng, years)
+        fm.get_transactions(type="Gider", year=year, month=month)
+
+    def filter_category():
+        fm.get_transactions_page(limit=500, category=rng.choice(categories), year=str(rng.choice(years)))
+
+    def search():
+        fm.search(rng.choice(DESCRIPTION_WORDS)[:3])
+
+    def summary():
+        fm.generate_summary(year=str(rng.choice(years)))
+
+    def summary_range():
+        year = rng.choice(years)
+        fm.generate_summary(start_date=f"{year}-02-01", end_date=f"{year}-04-30")
+
+    def report():
+        fm.get_budget_report()
+
+    def chart():
+        fm.generate_chart_data(rng.choice(["Gelir", "Gider", "Both"]), str(rng.choice(years)))
+
+    def dashboard():
+        year, month = _random_period(rng, years)
+        fm.generate_dashboard(year, month)
+
+    def delete_batch():
+        year, month = _random_period(rng, years)
+        rows, _, _ = fm.get_transactions_page(limit=100, year=year, month=month)
+        fm.delete_transactions([row[0] for row in rows])
+
+    return [
+        ("insert_single", insert_single),
+        ("insert_batch_1000", insert_batch),
+        ("filter_page", filter_page),
+        ("filter_month", filter_month),
+        ("filter_category", filter_category),
+        ("search", search),
+        ("summary", summary),
+        ("summary_date_range", summary_range),
+        ("budget_report", report),
+        ("chart", chart),
+        ("dashboard", dashboard),
+        ("delete_batch_100", delete_batch),
+    ]
+
+
+def run(db_path, repeat, profile, only=None, warmup=1, seed=7):
+    """Her işlemi `warmup` ısınma turundan sonra `repeat` kez ölçer; süreler saniyedir."""
+    rng = random.Random(seed)
+    db = Database(db_path, profile=profile)
+    fm = FinanceManager(db)
+    years = fm.get_available_years() or [datetime.now().year]
+    categories = fm.get_categories() or CATEGORIES
+    for year in years:
+        fm.set_budget(str(year), "01", 10000)
+    rows = db.count_transactions()
+    results = []
+    try:
+        for name, func in operations(fm, rng, years, categories):
+            if only and name not in only:
+                continue
+            samples = []
+            # Isınma turları tembel içe aktarmaları (pandas vb.) ölçümün dışında tutar
+            for attempt in range(warmup + repeat):
+                fm.cache.invalidate()
+                started = time.perf_counter()
+                func()
+                if attempt >= warmup:
+                    samples.append(time.perf_counter() - started)
+            results.append({
+                "operation": name,
+                "repeat": repeat,
+                "min": round(min(samples), 6),
+                "median": round(statistics.median(samples), 6),
+                "mean": round(statistics.fmean(samples), 6),
+                "max": round(max(samples), 6),
+            })
+    finally:
+        db.close()
+    return results, rows
+
+
+def compare(results, baseline_path):
+    """Medyan süreleri önceki bir sonuç dosyasıyla karşılaştırıp tablo olarak yazdırır."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {item["operation"]: item for item in json.load(f)["results"]}
+    print(f"{'İşlem':<22}{'Önceki (ms)':>14}{'Şimdi (ms)':>14}{'Oran':>8}")
+    for item in results:
+        before = baseline.get(item["operation"])
+        if before is None:
+            continue
+        ratio = item["median"] / before["median"] if before["median"] else float("inf")
+        print(f"{item['operation']:<22}{before['median'] * 1000:>14.2f}{item['median'] * 1000:>14.2f}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FinanceManager işlem ölçümleri")
+    parser.add_argument("--fixture", help="Kullanılacak hazır veritabanı (geçici bir kopyası ölçülür)")
+    parser.add_argument("--rows", type=int, default=100000, help="Fixture verilmezse üretilecek satır sayısı")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--categories", type=int, default=len(CATEGORIES))
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Her işlemin ölçülme sayısı")
+    parser.add_argument("--warmup", type=int, default=1, help="Ölçülmeyen ısınma turu sayısı")
+    parser.add_argument("--profile", choices=sorted(CONNECTION_PROFILES), default="performance")
+    parser.add_argument("--only", nargs="+", help="Yalnızca adı verilen işlemleri ölçer")
+    parser.add_argument("--label", default="", help="Sonuçlara eklenecek etiket (ör. dal veya commit)")
+    parser.add_argument("--output", help="JSON sonuçlarının yazılacağı dosya (varsayılan: stdout)")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="finance_bench_")
+    try:
+        path = os.path.join(workdir, "finance.db")
+        build_seconds = None
+        if args.fixture:
+            # Silme/ekleme ölçümleri asıl fixture'ı değiştirmesin diye kopyası kullanılır
+            shutil.copyfile(args.fixture, path)
+        else:
+            started = time.perf_counter()
+            build_database(path, args.rows, args.years, CATEGORIES[:args.categories], args.skew, args.seed,
+                           profile=args.profile).close()
+            build_seconds = round(time.perf_counter() - started, 4)
+        results, rows = run(path, args.repeat, args.profile, args.only, args.warmup)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    document = {
+        "meta": {
+            "label": args.label,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "fixture": args.fixture,
+            "rows": rows,
+            # Hazır fixture kullanıldığında üretici ayarları bilinmez
+            "generator": None if args.fixture else {
+                "years": args.years, "categories": args.categories, "skew": args.skew, "seed": args.seed
+            },
+            "profile": args.profile,
+            "build_seconds": build_seconds,
+        },
+        "results": results,
+    }
+    text = json.dumps(document, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
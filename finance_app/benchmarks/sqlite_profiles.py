@@ -0,0 +1,93 @@
+"""SQLite bağlantı profillerinin ekleme ve sorgu hızını karşılaştırır.
+
+Her profil finance.db'nin geçici bir kopyası üzerinde çalışır; asıl dosyaya
+dokunulmaz.
+
+    python -m benchmarks.sqlite_profiles --inserts 2000 --json
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from database import CONNECTION_PROFILES, Database
+from finance_manager import FinanceManager
+
+CATEGORIES = ["Kira", "Yiyecek", "Faturalar", "Ulaşım", "Eğlence", "Maaş"]
+
+
+def run_profile(source, profile, inserts, queries, seed=42):
+    """Bir profil için ekleme/sorgu sürelerini ölçer."""
+    rng = random.Random(seed)
+    workdir = tempfile.mkdtemp(prefix="finance_bench_")
+    try:
+        path = os.path.join(workdir, "finance.db")
+        if source and os.path.exists(source):
+            shutil.copyfile(source, path)
+        db = Database(path, profile=profile)
+        finance_manager = FinanceManager(db)
+
+        # Arayüzdeki gibi her ekleme ayrı commit edilir
+        started = time.perf_counter()
+        for _ in range(inserts):
+            finance_manager.add_transaction(
+                rng.choice(["Gelir", "Gider"]),
+                round(rng.uniform(10, 5000), 2),
+                rng.choice(CATEGORIES),
+                f"{rng.randint(2020, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "benchmark"
+            )
+        insert_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(queries):
+            finance_manager.get_transactions(
+                type=rng.choice(["Gelir", "Gider"]),
+                year=str(rng.randint(2020, 2025)),
+                month=f"{rng.randint(1, 12):02d}"
+            )
+            finance_manager.get_budget_report()
+        query_seconds = time.perf_counter() - started
+        settings = db.get_settings()
+        db.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "profile": profile,
+        "inserts": inserts,
+        "insert_seconds": round(insert_seconds, 4),
+        "inserts_per_second": round(inserts / insert_seconds, 1) if insert_seconds else None,
+        "queries": queries,
+        "query_seconds": round(query_seconds, 4),
+        "queries_per_second": round(queries / query_seconds, 1) if query_seconds else None,
+        "settings": settings,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite profil karşılaştırması")
+    parser.add_argument("--source", default="finance.db", help="Kopyalanacak veritabanı")
+    parser.add_argument("--profiles", nargs="+", default=sorted(CONNECTION_PROFILES),
+                        choices=sorted(CONNECTION_PROFILES))
+    parser.add_argument("--inserts", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdırır")
+    args = parser.parse_args(argv)
+
+    results = [run_profile(args.source, profile, args.inserts, args.queries) for profile in args.profiles]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return 0
+    print(f"{'Profil':<12}{'Ekleme/sn':>12}{'Sorgu/sn':>12}  journal/synchronous")
+    for result in results:
+        settings = result["settings"]
+        print(f"{result['profile']:<12}{result['inserts_per_second']:>12}{result['queries_per_second']:>12}"
+              f"  {settings['journal_mode']}/{settings['synchronous']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
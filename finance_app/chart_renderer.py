@@ -0,0 +1,167 @@
+"""Chart.js yapılandırmalarını tek başına açılabilen HTML sayfalarına dönüştürür.
+
+Chart.js, assets/ altındaki yerel kopyadan sayfaya gömülür; ağ bağlantısı
+gerekmez. Sayfa şablonu bir kez okunup önbelleğe alınır, çıktı geçici bir
+dosyaya yazılıp os.replace ile yerine taşınır ve grafik verisi
+değişmediyse dosya yeniden üretilmez.
+"""
+import functools
+import hashlib
+import html
+import json
+import os
+from atomic_file import atomic_output
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+CHART_JS_PATH = os.path.join(ASSETS_DIR, "chart.umd.min.js")
+# Gömülü kopyanın sürümü; güncellenirken assets/LICENSE.chartjs ve README de güncellenir
+CHART_JS_VERSION = "4.4.0"
+
+# Sayfanın ilk satırı; mevcut dosyanın hangi veriyle üretildiğini gösterir
+HASH_MARKER = "<!-- chart-hash: {} -->"
+
+PAGE_TEMPLATE = """{marker}
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <script>{chart_js}</script>
+    <style>
+        body {{ background: #212121; color: #FFFFFF; font-family: Arial, sans-serif; }}
+        .chart {{ max-width: 600px; max-height: 400px; margin: 20px auto; }}
+        #error {{ color: red; text-align: center; margin-top: 20px; }}
+    </style>
+</head>
+<body>
+    <h2 style="text-align: center;">{title}</h2>
+    <div id="charts"></div>
+    <div id="error" style="display: none;">Grafik yüklenemedi.</div>
+    <script>
+        // Yapılandırmalar saf JSON'dur; grafiklerin ihtiyaç duyduğu fonksiyonlar burada tanımlıdır
+        Chart.register({{
+            id: 'centerText',
+            beforeDraw: function(chart) {{
+                const options = chart.options.plugins.centerText;
+                if (!options || !options.display) {{
+                    return;
+                }}
+                const ctx = chart.ctx;
+                ctx.save();
+                ctx.font = 'bold 16px Arial';
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'middle';
+                ctx.fillStyle = '#FFFFFF';
+                ctx.fillText(String(options.text), chart.width / 2, chart.height / 2);
+                ctx.restore();
+            }}
+        }});
+        function percentLabel(context) {{
+            const label = context.label || '';
+            const value = context.parsed || 0;
+            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+            const percentage = total ? ((value / total) * 100).toFixed(2) : 0;
+            return `${{label}}: ${{value.toFixed(2)}} TL (${{percentage}}%)`;
+        }}
+        function prepare(config) {{
+            const tooltip = config.type === 'pie' && config.options && config.options.plugins
+                && config.options.plugins.tooltip;
+            if (tooltip && tooltip.enabled) {{
+                tooltip.callbacks = {{ label: percentLabel }};
+            }}
+            return config;
+        }}
+        try {{
+            const configs = {configs};
+            configs.forEach(function(config) {{
+                const canvas = document.createElement('canvas');
+                canvas.className = 'chart';
+                document.getElementById('charts').appendChild(canvas);
+                new Chart(canvas.getContext('2d'), prepare(config));
+            }});
+        }} catch (e) {{
+            document.getElementById('error').style.display = 'block';
+            console.error('Grafik hatası:', e);
+        }}
+    </script>
+</body>
+</html>
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _chart_js():
+    """Yerel Chart.js dosyasını bir kez okur."""
+    with open(CHART_JS_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=1)
+def _template():
+    """Chart.js gömülü sayfa şablonunu bir kez hazırlar."""
+    head, tail = PAGE_TEMPLATE.split("{chart_js}")
+    # Kütüphane kodu format alanı olarak yorumlanmasın diye şablona sonradan eklenir
+    return lambda **fields: head.format(**fields) + _chart_js() + tail.format(**fields)
+
+
+@functools.lru_cache(maxsize=1)
+def _chart_js_digest():
+    """Gömülü Chart.js dosyasının özeti; kütüphane değişince sayfalar yeniden üretilir."""
+    return hashlib.sha256(_chart_js().encode("utf-8")).hexdigest()
+
+
+def chart_hash(configs, title):
+    """Grafik verisinin, başlığın, şablonun ve gömülü Chart.js kopyasının özetini döndürür."""
+    payload = json.dumps([PAGE_TEMPLATE, _chart_js_digest(), title, configs], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _current_hash(path):
+    """Var olan sayfanın ilk satırındaki özeti okur."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+    prefix, suffix = HASH_MARKER.split("{}")
+    if first_line.startswith(prefix) and first_line.endswith(suffix):
+        return first_line[len(prefix):-len(suffix)].strip()
+    return None
+
+
+def render_page(configs, title):
+    """Bir veya birden çok Chart.js yapılandırması için HTML sayfasını üretir."""
+    if isinstance(configs, dict):
+        configs = [configs]
+    configs_json = json.dumps(configs, ensure_ascii=False).replace("</", "<\\/")
+    return _template()(
+        marker=HASH_MARKER.format(chart_hash(configs, title)),
+        title=html.escape(title),
+        configs=configs_json
+    )
+
+
+def render_chart(configs, title, path="chart.html"):
+    """Sayfayı `path` konumuna yazar; veri aynıysa dosyaya dokunmaz.
+
+    (mutlak yol, yeniden üretildi mi) döndürür.
+    """
+    if isinstance(configs, dict):
+        configs = [configs]
+    path = os.path.abspath(path)
+    if _current_hash(path) == chart_hash(configs, title):
+        return path, False
+    with atomic_output(path, encoding="utf-8", prefix=".chart_") as f:
+        f.write(render_page(configs, title))
+    return path, True
+
+
+def render_dashboard(bundle, path="dashboard.html", json_path="dashboard.json"):
+    """Pano paketini HTML sayfası ve JSON dosyası olarak yazar.
+
+    Sayfa değişmediyse ve JSON mevcutsa iki dosyaya da dokunulmaz.
+    """
+    path, changed = render_chart(list(bundle["charts"].values()), bundle["title"], path)
+    if json_path and (changed or not os.path.exists(json_path)):
+        with atomic_output(json_path, encoding="utf-8", prefix=".chart_") as f:
+            json.dump(bundle, f, ensure_ascii=False, indent=2)
+    return path, changed
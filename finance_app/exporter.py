@@ -0,0 +1,211 @@
+"""İşlemleri ve raporları CSV / JSON Lines / Parquet olarak dışa aktarır.
+
+Satırlar SQLite'tan fetchmany ile parça parça okunup doğrudan dosyaya
+yazılır; tablo ne kadar büyük olursa olsun bellekte yalnızca bir parça
+tutulur. Çıktı önce geçici bir dosyaya yazılır, tamamlanınca yerine taşınır.
+
+Kullanım:
+    python exporter.py islemler.csv --year 2024
+    python exporter.py islemler.jsonl --category Kira --start-date 2024-01-01
+    python exporter.py butce.csv --report budget
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+from atomic_file import atomic_output
+from database import CONNECTION_PROFILES, Database
+from finance_manager import FinanceManager
+
+TRANSACTION_EXPORT_COLUMNS = ("id", "type", "amount", "category", "date", "description")
+
+# Rapor adı -> (sütunlar, satır üreten fonksiyon); raporlar aylık özetten okunur ve küçüktür
+REPORTS = {
+    "transactions": (TRANSACTION_EXPORT_COLUMNS, None),
+    "budget": (
+        ("period", "budget", "expense", "remaining"),
+        lambda fm, year=None, month=None: fm.get_budget_report(year=year, month=month)
+    ),
+    "monthly": (
+        ("period", "type", "category", "total", "count"),
+        lambda fm, **filters: fm.pivot(("period", "type", "category"), measures=("sum", "count"), **filters)
+    ),
+}
+
+# Raporların desteklediği filtreler (None: hepsi); diğerleri yok sayılmak yerine reddedilir
+REPORT_FILTERS = {
+    "transactions": None,
+    "budget": ("year", "month"),
+    "monthly": ("category", "type", "year", "month"),
+}
+
+# Parquet şeması; burada olmayan sütunlar metin olarak yazılır
+PARQUET_TYPES = {
+    "id": "int64", "count": "int64",
+    "amount": "float64", "budget": "float64", "expense": "float64", "remaining": "float64", "total": "float64",
+}
+
+FORMAT_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_csv(rows, path, columns, chunk_size=5000, progress=None, delimiter=","):
+    """Satırları başlıklı CSV olarak yazar ve yazılan satır sayısını döndürür."""
+    written = 0
+    with atomic_output(path, newline="", encoding="utf-8", prefix=".export_") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(columns)
+        for chunk in _chunks(rows, chunk_size):
+            writer.writerows(chunk)
+            written += len(chunk)
+            if progress:
+                progress(written)
+    return written
+
+
+def write_jsonl(rows, path, columns, chunk_size=5000, progress=None):
+    """Her satırı sütun adlarıyla bir JSON nesnesi olarak ayrı satıra yazar."""
+    written = 0
+    with atomic_output(path, encoding="utf-8", prefix=".export_") as f:
+        for chunk in _chunks(rows, chunk_size):
+            f.writelines(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in chunk)
+            written += len(chunk)
+            if progress:
+                progress(written)
+    return written
+
+
+def write_parquet(rows, path, columns, chunk_size=50000, progress=None):
+    """Her parçayı ayrı bir satır grubu olarak Parquet dosyasına yazar (pyarrow gerekir)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet dışa aktarımı için pyarrow kurulu olmalı!")
+    schema = pa.schema([(column, getattr(pa, PARQUET_TYPES.get(column, "string"))()) for column in columns])
+    written = 0
+    with atomic_output(path, "wb", prefix=".export_") as f:
+        with pq.ParquetWriter(f, schema) as writer:
+            for chunk in _chunks(rows, chunk_size):
+                arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                written += len(chunk)
+                if progress:
+                    progress(written)
+    return written
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "parquet": write_parquet}
+
+
+def detect_format(path):
+    """Dosya uzantısından biçimi belirler."""
+    fmt = FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError("Dosya biçimi uzantıdan anlaşılamadı; --format ile belirtin!")
+    return fmt
+
+
+def _pivot_rows(pivot):
+    """pivot() sonucunu (period, type, category, total, count) satırlarına açar."""
+    totals, counts = pivot["values"]["sum"], pivot["values"]["count"]
+    for i, key in enumerate(pivot["rows"]):
+        for j in range(len(pivot["cols"])):
+            if totals[i][j] is not None:
+                yield key + (totals[i][j], counts[i][j])
+
+
+def unsupported_filters(report, filters):
+    """Raporun uygulayamadığı, değeri verilmiş filtre adlarını sıralı döndürür."""
+    allowed = REPORT_FILTERS[report]
+    if allowed is None:
+        return []
+    return sorted(name for name, value in filters.items() if value and name not in allowed)
+
+
+def export(finance_manager, path, fmt=None, report="transactions", chunk_size=5000, progress=None, **filters):
+    """Filtrelenmiş işlemleri ya da bir raporu `path` dosyasına yazar.
+
+    `progress(yazılan, toplam)` her parçadan sonra çağrılır; toplam yalnızca
+    işlem dökümünde bilinir. Yazılan satır sayısını döndürür.
+    """
+    if report not in REPORTS:
+        raise ValueError(f"Bilinmeyen rapor: {report}")
+    fmt = fmt or detect_format(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Desteklenmeyen biçim: {fmt}")
+    unsupported = unsupported_filters(report, filters)
+    if unsupported:
+        raise ValueError(f"'{report}' raporu şu filtreleri desteklemez: {', '.join(unsupported)}")
+    if REPORT_FILTERS[report] is not None:
+        filters = {name: value for name, value in filters.items() if name in REPORT_FILTERS[report]}
+    columns, build = REPORTS[report]
+    if build is None:
+        total = finance_manager.count_transactions(**filters)
+        rows = finance_manager.iter_transactions(chunk_size=chunk_size, **filters)
+    else:
+        result = build(finance_manager, **filters)
+        rows = list(_pivot_rows(result)) if report == "monthly" else result
+        total = len(rows)
+    on_chunk = (lambda written: progress(written, total)) if progress else None
+    return WRITERS[fmt](rows, path, columns, chunk_size=chunk_size, progress=on_chunk)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İşlemleri veya raporları dışa aktarır")
+    parser.add_argument("path", help="Çıktı dosyası (.csv, .jsonl, .parquet)")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="Dosya biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--report", choices=list(REPORTS), default="transactions", help="Dışa aktarılacak veri")
+    parser.add_argument("--db", default="finance.db", help="Veritabanı dosyası")
+    parser.add_argument("--db-profile", choices=sorted(CONNECTION_PROFILES), default="default",
+                        help="SQLite bağlantı profili")
+    parser.add_argument("--category", help="Kategori filtresi")
+    parser.add_argument("--type", choices=["Gelir", "Gider"], help="İşlem türü filtresi")
+    parser.add_argument("--year", help="Yıl filtresi (YYYY)")
+    parser.add_argument("--month", help="Ay filtresi (MM)")
+    parser.add_argument("--start-date", help="Başlangıç tarihi (YYYY-MM-DD, dahil)")
+    parser.add_argument("--end-date", help="Bitiş tarihi (YYYY-MM-DD, dahil)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Okuma/yazma parça boyutu")
+    args = parser.parse_args(argv)
+
+    filters = {"category": args.category, "type": args.type, "year": args.year, "month": args.month,
+               "start_date": args.start_date, "end_date": args.end_date}
+    unsupported = unsupported_filters(args.report, filters)
+    if unsupported:
+        parser.error(f"'{args.report}' raporu şu filtreleri desteklemez: {', '.join(unsupported)}")
+
+    def report_progress(written, total):
+        percent = f" (%{written * 100 // total})" if total else ""
+        print(f"\r{written}/{total}{percent}", end="", file=sys.stderr, flush=True)
+
+    db = Database(args.db, profile=args.db_profile)
+    finance_manager = FinanceManager(db)
+    started = time.perf_counter()
+    try:
+        written = export(
+            finance_manager, args.path, fmt=args.format, report=args.report,
+            chunk_size=args.chunk_size, progress=report_progress, **filters
+        )
+    except ValueError as e:
+        print(f"\nHata: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    print(f"\n{written} satır {time.perf_counter() - started:.2f} sn içinde {args.path} dosyasına yazıldı.",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
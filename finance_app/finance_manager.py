@@ -1,191 +1,1002 @@
-import pandas as pd
+import calendar
+import functools
 import json
 import os
-from datetime import datetime
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date as date_type, datetime, timedelta
+from itertools import islice
+from database import Database
+
+TRANSACTION_TYPES = ("Gelir", "Gider")
+TRANSACTION_FIELDS = ("type", "amount", "category", "date", "description")
+
+
+def normalize_date(value):
+    """Tarihi doğrulayıp YYYY-MM-DD biçiminde döndürür."""
+    if isinstance(value, (datetime, date_type)):
+        return value.strftime("%Y-%m-%d")
+    try:
+        return date_type.fromisoformat(str(value).strip()[:10]).isoformat()
+    except ValueError:
+        raise ValueError("Tarih formatı YYYY-MM-DD olmalı!")
+
+
+def validate_transaction(type, amount, category, date, description=None):
+    """İşlem alanlarını doğrular ve veritabanına yazılacak demeti döndürür."""
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        raise ValueError(f"Geçersiz miktar: {amount}")
+    if amount <= 0:
+        raise ValueError("Miktar pozitif olmalı!")
+    if type not in TRANSACTION_TYPES:
+        raise ValueError(f"Geçersiz işlem türü: {type}")
+    category = (category or "").strip()
+    if not category:
+        raise ValueError("Kategori boş olamaz!")
+    return type, amount, category, normalize_date(date), description or ""
+
+
+# Tekrar sıklığı kodu -> arayüz etiketi
+RECURRENCE_FREQUENCIES = {"weekly": "Haftalık", "monthly": "Aylık", "yearly": "Yıllık"}
+# Geçmişte ayda en fazla bu kadar günde harcama görülen kategoriler (kira, faturalar)
+# düzenli ödeme sayılır; vadesi geçip ödenmemiş tutarları tahmine eklenir
+REGULAR_PAYMENT_DAYS = 3
+
+
+def _add_months(start, months):
+    """Başlangıç gününe sabit kalarak ay ekler; kısa aylarda ayın son gününe iner (31 Oca → 28/29 Şub)."""
+    index = start.month - 1 + months
+    year, month = start.year + index // 12, index % 12 + 1
+    return date_type(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def occurrence_date(start, frequency, interval, index):
+    """Kuralın `index`. tekrarının (0 = başlangıç) tarihini döndürür."""
+    if frequency == "weekly":
+        return start + timedelta(weeks=interval * index)
+    return _add_months(start, interval * index * (12 if frequency == "yearly" else 1))
+
+
+def _occurrence_index(start, frequency, interval, day):
+    """`day` tarihinde veya öncesinde gerçekleşen son tekrarın sırasını döndürür."""
+    if frequency == "weekly":
+        return (day - start).days // (7 * interval)
+    step = interval * (12 if frequency == "yearly" else 1)
+    index = ((day.year - start.year) * 12 + day.month - start.month) // step
+    return index - 1 if occurrence_date(start, frequency, interval, index) > day else index
+
+
+def recurrence_dates(start, frequency, interval, until, last_date=None, end_date=None):
+    """`last_date` sonrasından `until` (ve varsa `end_date`) dahil tarihe kadarki tekrarları üretir.
+
+    Baştan saymak yerine son oluşturulan tekrarın sırasından devam edilir;
+    maliyet yalnızca yeni tekrarların sayısı kadardır.
+    """
+    limit = min(until, end_date) if end_date else until
+    index = 0 if last_date is None else _occurrence_index(start, frequency, interval, last_date) + 1
+    while True:
+        day = occurrence_date(start, frequency, interval, index)
+        if day > limit:
+            return
+        yield day
+        index += 1
+
+
+class QueryCache:
+    """Okuma sonuçları için sınırlı LRU önbellek.
+
+    Her yazma `invalidate` ile nesil sayacını artırır; önbellek ayrıca
+    veritabanının `data_version` değerini izleyerek başka bağlantılardan
+    (ör. arka plan worker'ı) yapılan yazmaları da fark eder.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._version = None
+
+    def get(self, key, compute, version=None):
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self):
+        self.generation += 1
+        self._entries.clear()
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "generation": self.generation,
+        }
+
+
+def _freeze(value):
+    """Liste/sözlük argümanları önbellek anahtarı olabilsin diye demete çevirir."""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def cached(method):
+    """FinanceManager okuma metodunun sonucunu (metot, argümanlar) anahtarıyla önbelleğe alır.
+
+    Önbellekten dönen nesneler paylaşılır; çağıranlar bunları değiştirmemelidir.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, _freeze(args), _freeze(kwargs))
+        return self.cache.get(
+            key, lambda: method(self, *args, **kwargs), (self.cache.generation, self.db.data_version())
+        )
+    return wrapper
+
+
+def invalidates(method):
+    """Veriyi değiştiren metottan sonra önbelleği geçersiz kılar."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.cache.invalidate()
+    return wrapper
+
+
+class TransactionStore:
+    """İşlemlerin sütun bazlı, sıkı bellek içi kopyası.
+
+    Satırlar id sırasıyla tutulur: tarihler gün numarası (array('i')),
+    tutarlar kuruş (array('q')), tür ve kategoriler küçük tamsayı kodları,
+    açıklamalar tek bir metin tablosuna indeks olarak saklanır. Filtre ve
+    toplamlar numpy ile doğrudan bu sütunlar üzerinde hesaplanır; numpy
+    görünümleri her çağrı içinde açılıp kapatılır, diziler büyümeye açık kalır.
+    """
+
+    __slots__ = ("ids", "dates", "amounts", "type_codes", "category_codes", "description_codes",
+                 "types", "categories", "descriptions", "date_texts", "_codes")
+
+    COLUMNS = ("ids", "dates", "amounts", "type_codes", "category_codes", "description_codes")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.dates = array("i")
+        self.amounts = array("q")
+        self.type_codes = array("b")
+        self.category_codes = array("H")
+        self.description_codes = array("i")
+        self.types = []
+        self.categories = []
+        self.descriptions = []
+        # Gün numarasından türetilemeyen tarih metinleri (saat içeren eski kayıtlar): id -> metin
+        self.date_texts = {}
+        self._codes = {}
+
+    @classmethod
+    def load(cls, db):
+        """Tüm işlemleri veritabanından bir kez okuyarak depo oluşturur."""
+        store = cls()
+        store.sync(db)
+        return store
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _code(self, table, kind, value):
+        code = self._codes.get((kind, value))
+        if code is None:
+            code = self._codes[(kind, value)] = len(table)
+            table.append(value)
+        return code
+
+    def sync(self, db):
+        """Son yüklenen id'den sonra eklenmiş satırları sütunların sonuna ekler."""
+        # Milyonlarca satırlık ilk yüklemede öznitelik aramaları döngü dışına alınır
+        add_id, add_date, add_amount = self.ids.append, self.dates.append, self.amounts.append
+        add_type, add_category = self.type_codes.append, self.category_codes.append
+        add_description = self.description_codes.append
+        for id_, type_, category, date_ord, amount_minor, date, description in db.iter_transaction_records(
+            self.ids[-1] if self.ids else 0
+        ):
+            add_id(id_)
+            add_date(date_ord)
+            add_amount(amount_minor)
+            add_type(self._code(self.types, "type", type_))
+            add_category(self._code(self.categories, "category", category))
+            # Açıklamalar da kalıcı kod tablosundan geçer; sonraki eşitlemeler aynı metni paylaşır
+            add_description(self._code(self.descriptions, "description", description))
+            if len(date) != 10:
+                self.date_texts[id_] = date
+
+    def refresh(self, db):
+        """Başka bir bağlantının yaptığı eklemeleri ve silmeleri depoya uygular.
+
+        İşlemler yerinde güncellenmez ve id'ler hiç yeniden kullanılmaz; bu
+        yüzden yeni id'leri eklemek ve artık olmayanları çıkarmak yeterlidir.
+        Silme olmadıysa id listesi hiç okunmaz.
+        """
+        self.sync(db)
+        if len(self.ids) != db.count_transactions():
+            import numpy as np
+            # Kopya: görünüm açık kalırsa remove diziyi küçültemez
+            ids = np.frombuffer(self.ids, dtype="q").copy()
+            present = np.fromstring(db.get_transaction_ids_text(), dtype="q", sep=",")
+            self.remove(ids[~np.isin(ids, present, assume_unique=True)].tolist())
+
+    def remove(self, ids):
+        """Verilen id'lere ait satırları sütunlardan çıkarır; çıkarılan satır sayısını döndürür."""
+        positions = set()
+        for id_ in ids:
+            position = bisect_left(self.ids, id_)
+            if position < len(self.ids) and self.ids[position] == id_:
+                positions.add(position)
+                self.date_texts.pop(id_, None)
+        if len(positions) == 1:
+            position = positions.pop()
+            for name in self.COLUMNS:
+                del getattr(self, name)[position]
+            return 1
+        if positions:
+            import numpy as np
+            keep = np.ones(len(self.ids), dtype=bool)
+            keep[list(positions)] = False
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                compacted = array(column.typecode)
+                compacted.frombytes(np.frombuffer(column, dtype=column.typecode)[keep].tobytes())
+                setattr(self, name, compacted)
+        return len(positions)
+
+    def _mask(self, np, category=None, type=None, year=None, month=None, start_date=None, end_date=None):
+        """Filtrelere uyan satırlar için boolean maske üretir."""
+        mask = np.ones(len(self.ids), dtype=bool)
+        for kind, value, column in (("category", category, self.category_codes), ("type", type, self.type_codes)):
+            if value:
+                code = self._codes.get((kind, value))
+                if code is None:
+                    return np.zeros(len(self.ids), dtype=bool)
+                mask &= np.frombuffer(column, dtype=column.typecode) == code
+        dates = np.frombuffer(self.dates, dtype="i")
+        if year:
+            start, end = Database._period_bounds(int(year), int(month) if month else None)
+            mask &= (dates >= start) & (dates < end)
+        elif month:
+            mask &= self._months(np, dates) % 12 + 1 == int(month)
+        if start_date:
+            mask &= dates >= Database._parse_date(start_date).toordinal()
+        if end_date:
+            mask &= dates <= Database._parse_date(end_date).toordinal()
+        return mask
+
+    @staticmethod
+    def _months(np, dates):
+        """Gün numaralarını 1970-01'den bu yana geçen ay sayısına çevirir."""
+        days = dates.astype("int64") - date_type(1970, 1, 1).toordinal()
+        return days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+
+    def select(self, **filters):
+        """Filtrelere uyan satırların konumlarını (tarih, id) sırasıyla döndürür."""
+        import numpy as np
+        positions = np.flatnonzero(self._mask(np, **filters))
+        dates = np.frombuffer(self.dates, dtype="i")[positions]
+        return positions[np.argsort(dates, kind="stable")].tolist()
+
+    def count(self, **filters):
+        import numpy as np
+        return int(np.count_nonzero(self._mask(np, **filters)))
+
+    def rows(self, positions):
+        """Konumlardaki satırları (id, type, amount, category, date, description) demetleri olarak döndürür."""
+        rows = []
+        for position in positions:
+            id_ = self.ids[position]
+            date = self.date_texts.get(id_) or date_type.fromordinal(self.dates[position]).isoformat()
+            rows.append((
+                id_, self.types[self.type_codes[position]], self.amounts[position] / 100.0,
+                self.categories[self.category_codes[position]], date,
+                self.descriptions[self.description_codes[position]]
+            ))
+        return rows
+
+    def get_transactions(self, **filters):
+        return self.rows(self.select(**filters))
+
+    def totals(self, by="category", **filters):
+        """Filtrelenmiş tutarları `by` (type, category, period) boyutuna göre toplar.
+
+        (anahtar, toplam TL) listesini anahtara göre sıralı döndürür.
+        """
+        import numpy as np
+        mask = self._mask(np, **filters)
+        amounts = np.frombuffer(self.amounts, dtype="q")[mask]
+        if by in ("type", "category"):
+            column, names = (self.type_codes, self.types) if by == "type" else (self.category_codes, self.categories)
+            codes = np.frombuffer(column, dtype=column.typecode)[mask].astype("int64")
+            keys = [names[code] for code in range(len(names))]
+        elif by == "period":
+            months = self._months(np, np.frombuffer(self.dates, dtype="i")[mask])
+            unique, codes = np.unique(months, return_inverse=True)
+            keys = [f"{1970 + month // 12:04d}-{month % 12 + 1:02d}" for month in unique.tolist()]
+        else:
+            raise ValueError(f"Bilinmeyen toplama boyutu: {by}")
+        # Kuruş toplamları 2**53'ün altında kaldıkça float64 ağırlıklar tam sonuç verir
+        sums = np.bincount(codes, weights=amounts, minlength=len(keys))
+        counts = np.bincount(codes, minlength=len(keys))
+        return sorted(
+            (keys[code], int(round(sums[code])) / 100.0) for code in range(len(keys)) if counts[code]
+        )
+
+    def nbytes(self):
+        """Sütunların ve metin tablolarının yaklaşık bellek kullanımı (bayt)."""
+        total = sum(getattr(self, name).buffer_info()[1] * getattr(self, name).itemsize for name in self.COLUMNS)
+        for table in (self.types, self.categories, self.descriptions):
+            total += sys.getsizeof(table) + sum(sys.getsizeof(value) for value in table)
+        return total + sys.getsizeof(self.date_texts) + sum(sys.getsizeof(value) for value in self.date_texts.values())
+
+
+CHART_COLORS = [
+    "#FF6384", "#36A2EB", "#FFCE56", "#4BC0C0", "#9966FF",
+    "#FF9F40", "#E57373", "#81C784", "#64B5F6", "#FFD54F",
+    "#4DD0E1", "#9575CD", "#F06292", "#AED581", "#4FC3F7"
+]
+
+
+def pie_chart_config(label, category_totals):
+    """(kategori, toplam) listesinden Chart.js pasta grafiği yapılandırması üretir."""
+    if not category_totals:
+        return {
+            "type": "pie",
+            "data": {
+                "labels": ["Veri Yok"],
+                "datasets": [{
+                    "label": "Dağılım",
+                    "data": [1],
+                    "backgroundColor": ["#CCCCCC"],
+                    "borderColor": ["#FFFFFF"],
+                    "borderWidth": 1
+                }]
+            },
+            "options": {
+                "responsive": True,
+                "plugins": {
+                    "legend": {"position": "top"},
+                    "tooltip": {"enabled": False},
+                    "centerText": {"display": False}
+                }
+            }
+        }
+
+    labels = [category for category, _ in category_totals]
+    data = [total for _, total in category_totals]
+    total = sum(data)
+
+    return {
+        "type": "pie",
+        "data": {
+            "labels": labels,
+            "datasets": [{
+                "label": label,
+                "data": data,
+                "backgroundColor": CHART_COLORS[:len(labels)],
+                "borderColor": ["#FFFFFF"] * len(labels),
+                "borderWidth": 1
+            }]
+        },
+        "options": {
+            "responsive": True,
+            "plugins": {
+                "legend": {"position": "top"},
+                # Yüzdeli etiket ve ortadaki toplam yazısı sayfa şablonundaki JS tarafından çizilir
+                "tooltip": {"enabled": True},
+                "centerText": {
+                    "display": True,
+                    "text": f"Toplam: {total:.2f} TL"
+                }
+            }
+        }
+    }
+
+
+def series_chart_config(chart_type, title, labels, datasets):
+    """Dönem etiketleri ve (ad, değerler, renk) üçlülerinden çizgi/çubuk grafiği üretir."""
+    return {
+        "type": chart_type,
+        "data": {
+            "labels": labels,
+            "datasets": [{
+                "label": name,
+                "data": values,
+                "backgroundColor": color,
+                "borderColor": color,
+                "borderWidth": 2,
+                "fill": False
+            } for name, values, color in datasets]
+        },
+        "options": {
+            "responsive": True,
+            "plugins": {
+                "legend": {"position": "top"},
+                "title": {"display": True, "text": title}
+            },
+            "scales": {"y": {"beginAtZero": True}}
+        }
+    }
+
+
+DEFAULT_CATEGORIES = [
+    "Maaş", "Kira", "Yiyecek", "Eğlence", "Ev Bakımı",
+    "Faturalar", "Ulaşım", "Sağlık", "Eğitim", "Alışveriş",
+    "Yatırım", "Borç", "Kredi Kartı", "Kişisel Bakım", "Diğer"
+]
+
 
 class FinanceManager:
-    def __init__(self, db):
+    def __init__(self, db, cache_size=64, in_memory=False):
         self.db = db
-        categories = [
-            "Maaş", "Kira", "Yiyecek", "Eğlence", "Ev Bakımı",
-            "Faturalar", "Ulaşım", "Sağlık", "Eğitim", "Alışveriş",
-            "Yatırım", "Borç", "Kredi Kartı", "Kişisel Bakım", "Diğer"
-        ]
-        for cat in categories:
-            self.db.add_category(cat)
+        self.cache = QueryCache(cache_size)
+        # in_memory açıkken işlem listesi, sayım ve tarih aralığı özetleri SQL yerine
+        # sütun bazlı bellek içi kopyadan hesaplanır; kopya ilk istendiğinde yüklenir
+        self.in_memory = in_memory
+        self._store = None
+        self._store_version = None
+        # Varsayılan kategoriler yalnızca tablo boşken tek seferde eklenir
+        self.db.seed_categories(DEFAULT_CATEGORIES)
 
+    @invalidates
     def add_transaction(self, type, amount, category, date, description):
+        self.db.add_transaction(type, amount, category, normalize_date(date), description)
+        self._sync_store()
+
+    @invalidates
+    def import_transactions(self, rows, chunk_size=5000, on_reject=None):
+        """İşlemleri parçalar halinde doğrulayıp tek bir veritabanı işlemiyle ekler.
+
+        `rows` sözlük ya da (type, amount, category, date, description) demetleri
+        üreten herhangi bir yinelenebilir olabilir. Eklenen satır sayısını ve
+        reddedilen (satır_no, satır, neden) kayıtlarını döndürür; `on_reject`
+        verilirse reddedilenler listede biriktirilmek yerine ona iletilir.
+        """
+        rejected = []
+        if on_reject is None:
+            on_reject = lambda *item: rejected.append(item)
+        known_categories = set(self.get_categories())
+        inserted = 0
+        numbered = enumerate(rows, 1)
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            date = date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Tarih formatı YYYY-MM-DD olmalı!")
-        self.db.add_transaction(type, amount, category, date, description)
+            while True:
+                chunk = list(islice(numbered, chunk_size))
+                if not chunk:
+                    break
+                valid = []
+                new_categories = set()
+                for line_no, row in chunk:
+                    try:
+                        if isinstance(row, dict):
+                            values = validate_transaction(*(row.get(field) for field in TRANSACTION_FIELDS))
+                        else:
+                            values = validate_transaction(*row)
+                    except (TypeError, ValueError) as e:
+                        on_reject(line_no, row, str(e))
+                        continue
+                    valid.append(values)
+                    if values[2] not in known_categories:
+                        new_categories.add(values[2])
+                if new_categories:
+                    self.db.add_categories(new_categories, commit=False)
+                    known_categories.update(new_categories)
+                self.db.add_transactions(valid, commit=False)
+                inserted += len(valid)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self._sync_store()
+        return inserted, rejected
 
+    @invalidates
     def delete_transaction(self, id):
         self.db.delete_transaction(id)
+        if self._store is not None:
+            self._store.remove([id])
 
-    def get_transactions(self, category=None, type=None, year=None, month=None):
-        transactions = self.db.get_transactions(category=category, type=type)
-        if year or month:
-            filtered = []
-            for t in transactions:
-                try:
-                    date_str = t[4]
-                    date = datetime.strptime(date_str, "%Y-%m-%d")
-                    if year and str(date.year) != year:
-                        continue
-                    if month and date.month != int(month):
-                        continue
-                    filtered.append(t)
-                except ValueError:
-                    continue
-            return filtered
-        return transactions
+    @invalidates
+    def delete_transactions(self, ids):
+        ids = list(ids)
+        deleted = self.db.delete_transactions(ids)
+        if self._store is not None:
+            self._store.remove(ids)
+        return deleted
+
+    def transaction_store(self):
+        """İşlemlerin sütun bazlı bellek içi kopyasını döndürür.
+
+        İlk çağrıda bir kez yüklenir; bu yöneticinin ekleme/silmeleriyle
+        güncel tutulur. Başka bir bağlantı (ör. arayüzün yazma bağlantısı)
+        veritabanını değiştirdiyse yalnızca farklar uygulanır.
+        """
+        # Sürüm yenilemeden önce okunur: arada gelen bir yazma sonraki çağrıda yakalanır
+        version = self.db.data_version()
+        if self._store is None:
+            self._store = TransactionStore.load(self.db)
+        elif self._store_version != version:
+            self._store.refresh(self.db)
+        self._store_version = version
+        return self._store
+
+    def _sync_store(self):
+        if self._store is not None:
+            self._store.sync(self.db)
+
+    @invalidates
+    def add_recurring_rule(self, type, amount, category, start_date, frequency="monthly", interval=1,
+                           description=None, end_date=None):
+        """Tekrarlayan işlem kuralı ekler; tekrarlar `materialize_recurring` ile oluşturulur."""
+        type, amount, category, start_date, description = validate_transaction(
+            type, amount, category, start_date, description
+        )
+        if frequency not in RECURRENCE_FREQUENCIES:
+            raise ValueError(f"Geçersiz tekrar sıklığı: {frequency}")
+        try:
+            interval = int(interval)
+        except (TypeError, ValueError):
+            raise ValueError(f"Geçersiz tekrar aralığı: {interval}")
+        if interval < 1:
+            raise ValueError("Tekrar aralığı en az 1 olmalı!")
+        if end_date:
+            end_date = normalize_date(end_date)
+            if end_date < start_date:
+                raise ValueError("Bitiş tarihi başlangıç tarihinden önce olamaz!")
+        return self.db.add_recurring_rule(
+            type, amount, category, description, frequency, interval, start_date, end_date or None
+        )
+
+    @cached
+    def get_recurring_rules(self):
+        """(id, type, amount, category, description, frequency, interval, start_date, end_date, last_date) listesi."""
+        return self.db.get_recurring_rules()
+
+    @invalidates
+    def delete_recurring_rule(self, id):
+        """Kuralı siler; daha önce oluşturulmuş işlemler yerinde kalır."""
+        self.db.delete_recurring_rule(id)
+
+    @invalidates
+    def materialize_recurring(self, until=None):
+        """Vadesi gelmiş tüm tekrarları tek toplu eklemeyle işlemlere dönüştürür.
 
+        Her kuralın son oluşturulan tarihi eklemeyle aynı işlemde güncellenir;
+        uzun bir aradan sonra yalnızca eksik tekrarlar eklenir, hiçbir tekrar
+        iki kez oluşturulmaz. Eklenen işlem sayısını döndürür.
+        """
+        until = date_type.fromisoformat(normalize_date(until or date_type.today()))
+        rows = []
+        updates = []
+        # Aynı anda çalışan ikinci bir uygulama kilidi bekler ve güncellenmiş last_date değerlerini görür
+        self.db.begin_immediate()
+        try:
+            for (id_, type_, amount, category, description, frequency, interval,
+                 start_date, end_date, last_date) in self.db.get_due_recurring_rules(until.isoformat()):
+                dates = list(recurrence_dates(
+                    date_type.fromisoformat(start_date), frequency, interval, until,
+                    date_type.fromisoformat(last_date) if last_date else None,
+                    date_type.fromisoformat(end_date) if end_date else None
+                ))
+                if dates:
+                    rows.extend((type_, amount, category, day.isoformat(), description) for day in dates)
+                    updates.append((dates[-1].isoformat(), id_))
+            if rows:
+                self.db.add_transactions(rows, commit=False)
+                self.db.set_recurring_last_dates(updates, commit=False)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        if rows:
+            self._sync_store()
+        return len(rows)
+
+    @cached
+    def get_transactions(self, category=None, type=None, year=None, month=None,
+                         start_date=None, end_date=None):
+        if self.in_memory:
+            return self.transaction_store().get_transactions(
+                category=category, type=type, year=year, month=month,
+                start_date=start_date, end_date=end_date
+            )
+        return self.db.get_transactions(
+            category=category, type=type, year=year, month=month,
+            start_date=start_date, end_date=end_date
+        )
+
+    @cached
+    def get_transactions_page(self, limit=500, after=None, with_total=False, descending=False, **filters):
+        """Anahtar imleçli sayfalama: (satırlar, sonraki_imleç, toplam) döndürür."""
+        rows, next_cursor, _ = self.db.get_transactions_page(
+            limit=limit, after=after, descending=descending, **filters
+        )
+        return rows, next_cursor, self.count_transactions(**filters) if with_total else None
+
+    @cached
+    def count_transactions(self, **filters):
+        if self.in_memory:
+            return self.transaction_store().count(**filters)
+        return self.db.count_transactions(**filters)
+
+    @cached
+    def search(self, text, limit=200, **filters):
+        """Açıklamalarda kelime öneki araması; en alakalı `limit` işlemi döndürür."""
+        return self.db.search_transactions(text, limit=limit, **filters)
+
+    def iter_transactions(self, chunk_size=1000, **filters):
+        """Tüm eşleşen işlemleri sabit bellekle sırayla üretir."""
+        return self.db.iter_transactions(chunk_size=chunk_size, **filters)
+
+    @cached
     def get_categories(self):
         return self.db.get_categories()
 
+    @invalidates
     def set_budget(self, year, month, amount):
         self.db.set_budget(year, month, amount)
 
+    @cached
     def get_budget(self, year, month):
         return self.db.get_budget(year, month)
 
-    def get_budget_report(self, year=None, month=None):
+    @invalidates
+    def set_category_budget(self, year, month, category, amount):
+        """Bir kategorinin aylık gider limitini kaydeder."""
+        category = (category or "").strip()
+        if not category:
+            raise ValueError("Kategori boş olamaz!")
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            raise ValueError(f"Geçersiz miktar: {amount}")
+        if amount <= 0:
+            raise ValueError("Bütçe pozitif olmalı!")
+        self.db.set_category_budget(year, month, category, amount)
+
+    @invalidates
+    def delete_category_budget(self, year, month, category):
+        self.db.delete_category_budget(year, month, category)
+
+    @cached
+    def budget_status(self, year, month):
+        """Ayın tüm kategorileri için limit ve gideri tek sorguda karşılaştırır.
+
+        {"category", "limit", "spent", "remaining", "used"} sözlüklerinin
+        listesini döndürür; limiti olmayan kategorilerde limit, remaining ve
+        used None'dır, used harcanan/limit oranıdır.
+        """
+        return [
+            {
+                "category": category,
+                "limit": limit,
+                "spent": round(spent, 2),
+                "remaining": round(limit - spent, 2) if limit else None,
+                "used": round(spent / limit, 4) if limit else None,
+            }
+            for category, limit, spent in self.db.get_budget_status(year, month)
+        ]
+
+    @cached
+    def get_budget_report(self, year=None, month=None, start_date=None, end_date=None):
         """Bütçe ve gider raporunu döndürür."""
-        transactions = self.get_transactions(type="Gider", year=year, month=month)
-        df = pd.DataFrame(transactions, columns=["id", "type", "amount", "category", "date", "description"])
-        if df.empty:
-            return []
-
-        def parse_date(date_str):
-            try:
-                return pd.to_datetime(date_str, format="%Y-%m-%d")
-            except ValueError:
-                return pd.NaT
-
-        df["date"] = df["date"].apply(parse_date)
-        df = df.dropna(subset=["date"])
-        df["month"] = df["date"].dt.to_period("M")
-        expense_summary = df.groupby("month")["amount"].sum().reset_index()
-        report = []
-        for _, row in expense_summary.iterrows():
-            period = str(row["month"])
-            y, m = period.split("-")
-            budget = self.get_budget(y, m.zfill(2)) or 0.0
-            expense = float(row["amount"])
-            remaining = budget - expense
-            report.append((period, budget, expense, remaining))
-        return sorted(report, key=lambda x: x[0])
-
-    def generate_summary(self, year=None, month=None):
-        transactions = self.get_transactions(year=year, month=month)
-        df = pd.DataFrame(transactions, columns=["id", "type", "amount", "category", "date", "description"])
-        if df.empty:
-            return pd.DataFrame(columns=["Gelir", "Gider"])
+        if start_date or end_date:
+            import analytics
+            frame = self.analytics_frame(year=year, month=month, start_date=start_date, end_date=end_date)
+            return analytics.budget_report(frame, self.db.get_budgets())
+        return self.db.get_budget_report(year=year, month=month)
+
+    @cached
+    def get_period_total(self, year=None, month=None, type=None, category=None):
+        """Aylık özet tablosundan dönem toplamını döndürür."""
+        return self.db.get_period_total(year=year, month=month, type=type, category=category)
+
+    @cached
+    def analytics_frame(self, category=None, type=None, year=None, month=None,
+                        start_date=None, end_date=None):
+        """Aynı filtre için özet, rapor ve grafik hesaplarının paylaştığı DataFrame'i döndürür.
+
+        Aylık özet tablosunun karşılayamadığı keyfi tarih aralıklarında kullanılır.
+        """
+        import analytics
+        return analytics.load_frame(
+            self.db, category=category, type=type, year=year, month=month,
+            start_date=start_date, end_date=end_date
+        )
+
+    @cached
+    def pivot(self, rows, cols=(), measures=("sum",), **filters):
+        """Satır × sütun boyutlarına göre ölçüleri tek sorguda hesaplayan pivot tablo.
 
-        def parse_date(date_str):
-            try:
-                return pd.to_datetime(date_str, format="%Y-%m-%d")
-            except ValueError:
-                return pd.NaT
-
-        df["date"] = df["date"].apply(parse_date)
-        df = df.dropna(subset=["date"])
-        df["month"] = df["date"].dt.to_period("M")
-        summary = df.groupby(["month", "type"])["amount"].sum().unstack().fillna(0)
-        return summary
-
-    def generate_chart_data(self, chart_type, year=None, month=None):
-        if chart_type == "Both":
-            transactions = self.get_transactions(year=year, month=month)
+        Boyutlar: year, month, period, type, category. Ölçüler: sum, count,
+        mean, min, max. Sonuç sütun bazlıdır: `rows` ve `cols` boyut
+        değerlerinin demet listeleri, `values[ölçü][i][j]` ise i. satır ile
+        j. sütunun değeridir (veri yoksa None).
+        """
+        rows, cols, measures = tuple(rows), tuple(cols), tuple(measures)
+        if not rows and not cols:
+            raise ValueError("Pivot için en az bir boyut gerekli!")
+        records = self.db.aggregate(rows + cols, measures, **filters)
+        split = len(rows)
+        width = len(rows) + len(cols)
+        row_keys = sorted({record[:split] for record in records})
+        col_keys = sorted({record[split:width] for record in records})
+        row_index = {key: i for i, key in enumerate(row_keys)}
+        col_index = {key: j for j, key in enumerate(col_keys)}
+        values = {measure: [[None] * len(col_keys) for _ in row_keys] for measure in measures}
+        for record in records:
+            i = row_index[record[:split]]
+            j = col_index[record[split:width]]
+            for offset, measure in enumerate(measures):
+                values[measure][i][j] = record[width + offset]
+        return {
+            "row_dimensions": list(rows),
+            "col_dimensions": list(cols),
+            "rows": row_keys,
+            "cols": col_keys,
+            "measures": list(measures),
+            "values": values,
+        }
+
+    @cached
+    def get_available_years(self):
+        """İşlem bulunan yılları döndürür."""
+        return self.db.get_available_years()
+
+    @cached
+    def get_year_months(self):
+        """İşlem bulunan yıl-ay çiftlerini satır sayılarıyla döndürür."""
+        return self.db.get_year_months()
+
+    def cache_info(self):
+        """Önbellek isabet/ıska sayaçlarını tanılama için döndürür."""
+        return self.cache.info()
+
+    @invalidates
+    def rebuild_monthly_totals(self):
+        """Aylık ve günlük özet tablolarını işlemlerden yeniden oluşturur."""
+        self.db.rebuild_monthly_totals(commit=False)
+        self.db.rebuild_daily_totals()
+
+    def verify_monthly_totals(self):
+        return self.db.verify_monthly_totals()
+
+    @cached
+    def generate_summary(self, year=None, month=None, start_date=None, end_date=None):
+        # pandas yalnızca özet istendiğinde yüklenir; açılış süresine eklenmez
+        import pandas as pd
+
+        if start_date or end_date:
+            if not self.in_memory:
+                import analytics
+                frame = self.analytics_frame(year=year, month=month, start_date=start_date, end_date=end_date)
+                return analytics.monthly_summary(frame)
+            store = self.transaction_store()
+            rows = [
+                (int(period[:4]), int(period[5:]), type_, total)
+                for type_ in sorted(store.types)
+                for period, total in store.totals(
+                    "period", type=type_, year=year, month=month, start_date=start_date, end_date=end_date
+                )
+            ]
         else:
-            transactions = self.get_transactions(type=chart_type, year=year, month=month)
-
-        df = pd.DataFrame(transactions, columns=["id", "type", "amount", "category", "date", "description"])
-        if df.empty:
-            return {
-                "type": "pie",
-                "data": {
-                    "labels": ["Veri Yok"],
-                    "datasets": [{
-                        "label": "Dağılım",
-                        "data": [1],
-                        "backgroundColor": ["#CCCCCC"],
-                        "borderColor": ["#FFFFFF"],
-                        "borderWidth": 1
-                    }]
-                },
-                "options": {
-                    "responsive": True,
-                    "plugins": {
-                        "legend": {"position": "top"},
-                        "tooltip": {"enabled": False},
-                        "centerText": {"display": False}
-                    }
-                }
+            rows = self.db.get_monthly_summary(year=year, month=month)
+        if not rows:
+            return pd.DataFrame(columns=["Gelir", "Gider"])
+
+        totals = {}
+        for y, m, type_, total in rows:
+            totals.setdefault(pd.Period(year=y, month=m, freq="M"), {})[type_] = total
+        summary = pd.DataFrame.from_dict(totals, orient="index").fillna(0)
+        summary.index.name = "month"
+        summary.columns.name = "type"
+        return summary.sort_index()
+
+    @cached
+    def generate_dashboard(self, year=None, month=None):
+        """Aylık inceleme panosunun tüm grafiklerini tek toplama sorgusundan üretir.
+
+        Zaman serileri `year` içindeki tüm ayları, kategori pastaları ise
+        verilmişse yalnızca `month` ayını kapsar. Sonuç chart_data.json
+        biçimini genişletir: "charts" altında her grafik için bir Chart.js
+        yapılandırması bulunur.
+        """
+        records = self.db.aggregate(("period", "type", "category"), ("sum",), year=year)
+        budgets = self.db.get_budgets()
+        selected_month = f"{int(month):02d}" if month else None
+
+        totals = {}
+        categories = {"Gelir": {}, "Gider": {}}
+        for period, type_, category, total in records:
+            period_totals = totals.setdefault(period, {"Gelir": 0.0, "Gider": 0.0})
+            period_totals[type_] = period_totals.get(type_, 0.0) + total
+            if selected_month is None or period[5:7] == selected_month:
+                by_category = categories.setdefault(type_, {})
+                by_category[category] = by_category.get(category, 0.0) + total
+
+        periods = sorted(totals)
+        income = [round(totals[period]["Gelir"], 2) for period in periods]
+        expense = [round(totals[period]["Gider"], 2) for period in periods]
+        budget = [budgets.get(period, 0.0) for period in periods]
+        scope = str(year) if year else "Tüm Yıllar"
+        pie_scope = f"{year or 'Tüm Yıllar'}-{selected_month}" if selected_month else scope
+
+        return {
+            "version": 1,
+            "title": f"Finans Panosu ({pie_scope})",
+            "year": year,
+            "month": selected_month,
+            "periods": periods,
+            "charts": {
+                "expense_trend": series_chart_config(
+                    "line", f"Aylık Gider Eğilimi ({scope})", periods,
+                    [("Gider", expense, "#F44336")]
+                ),
+                "income_vs_expense": series_chart_config(
+                    "bar", f"Aylık Gelir ve Gider ({scope})", periods,
+                    [("Gelir", income, "#4CAF50"), ("Gider", expense, "#F44336")]
+                ),
+                "budget_vs_actual": series_chart_config(
+                    "bar", f"Bütçe ve Gerçekleşen Gider ({scope})", periods,
+                    [("Bütçe", budget, "#2196F3"), ("Gider", expense, "#F44336")]
+                ),
+                "income_categories": pie_chart_config(
+                    f"Gelir Dağılımı ({pie_scope})",
+                    [(c, round(t, 2)) for c, t in sorted(categories["Gelir"].items())]
+                ),
+                "expense_categories": pie_chart_config(
+                    f"Gider Dağılımı ({pie_scope})",
+                    [(c, round(t, 2)) for c, t in sorted(categories["Gider"].items())]
+                ),
             }
+        }
 
-        category_totals = df.groupby("category")["amount"].sum().reset_index()
-        labels = category_totals["category"].tolist()
-        data = category_totals["amount"].tolist()
-        total = sum(data)
-        colors = [
-            "#FF6384", "#36A2EB", "#FFCE56", "#4BC0C0", "#9966FF",
-            "#FF9F40", "#E57373", "#81C784", "#64B5F6", "#FFD54F",
-            "#4DD0E1", "#9575CD", "#F06292", "#AED581", "#4FC3F7"
-        ]
+    def forecast_month(self, year=None, month=None, today=None):
+        """Ay sonunda kategori bazında ulaşılacak gideri tahmin eder (varsayılan: bu ay).
+
+        Tahmin = bugüne kadar harcanan + kategorinin ayın kalan günlerinde
+        harcaması beklenen tutar. Beklenen aylık tutar son 12 ayın ortalaması
+        ile o takvim ayının mevsimsel katsayısının çarpımıdır; kalan kısım son
+        12 ayda harcamanın ay içindeki günlere dağılımından bulunur (ör. kira
+        ayın 5'inde ödendiyse ay sonuna kadar kira beklenmez). Geçmişte ayda
+        birkaç günde ödenen düzenli giderlerde bugüne kadar beklenip ödenmemiş
+        tutar da eklenir; böylece gecikmiş bir kira ödemesi tahmine girer.
+        """
+        today = date_type.fromisoformat(normalize_date(today or date_type.today()))
+        # Önbellek anahtarı gün değişince değişsin diye tarih burada çözülür
+        return self._forecast_month(int(year or today.year), int(month or today.month), today.isoformat())
 
+    @cached
+    def _forecast_month(self, year, month, today):
+        """Aylık ve günlük toplamlar özet tablolarından okunur; hesaplar tüm
+        kategoriler için numpy ile birlikte yapılır."""
+        import numpy as np
+        today = date_type.fromisoformat(today)
+        period = f"{year:04d}-{month:02d}"
+        month_start = date_type(year, month, 1)
+        days_in_month = calendar.monthrange(year, month)[1]
+        if period < today.strftime("%Y-%m"):
+            day = days_in_month
+        elif period > today.strftime("%Y-%m"):
+            day = 0
+        else:
+            day = today.day
+
+        history = [row for row in self.db.aggregate(("period", "category"), ("sum",), type="Gider") if row[0] < period]
+        # Hedef ayın ve önceki 12 ayın günlük toplamları tek sorguda
+        daily = self.db.get_daily_totals(
+            _add_months(month_start, -12), date_type(year, month, days_in_month)
+        )
+        categories = sorted({row[1] for row in history} | {row[0] for row in daily})
+        index = {category: i for i, category in enumerate(categories)}
+
+        # Kategori x ay matrisi: ilk kayıtlı aydan hedef aydan önceki aya kadar
+        baseline = np.zeros(len(categories))
+        if history:
+            first = min(int(p[:4]) * 12 + int(p[5:7]) - 1 for p, _, _ in history)
+            matrix = np.zeros((len(categories), year * 12 + month - 1 - first))
+            matrix[
+                [index[category] for _, category, _ in history],
+                [int(p[:4]) * 12 + int(p[5:7]) - 1 - first for p, _, _ in history]
+            ] = [total for _, _, total in history]
+            same_month = (np.arange(matrix.shape[1]) + first) % 12 + 1 == month
+            overall = matrix.mean(axis=1)
+            seasonal = np.ones(len(categories))
+            if same_month.any():
+                np.divide(matrix[:, same_month].mean(axis=1), overall, out=seasonal, where=overall > 0)
+            baseline = matrix[:, -12:].mean(axis=1) * seasonal
+
+        # Hedef ayın günlük birikimli toplamları ve geçmişte ayın günlerine göre harcama dağılımı
+        current = np.zeros((len(categories), days_in_month))
+        by_day = np.zeros((len(categories), days_in_month))
+        regular = np.zeros(len(categories), dtype=bool)
+        if daily:
+            rows = np.array([index[category] for category, _, _ in daily])
+            ordinals = np.array([date_ord for _, date_ord, _ in daily], dtype="int64")
+            totals = np.array([total for _, _, total in daily], dtype="float64") / 100.0
+            in_month = ordinals >= month_start.toordinal()
+            np.add.at(current, (rows[in_month], ordinals[in_month] - month_start.toordinal()), totals[in_month])
+            days = ordinals[~in_month] - date_type(1970, 1, 1).toordinal()
+            day_of_month = (days.astype("datetime64[D]") - days.astype("datetime64[D]").astype("datetime64[M]")).astype("int64")
+            # 31 günlük ayların son günleri kısa hedef ayın son gününe sayılır
+            np.add.at(by_day, (rows[~in_month], np.minimum(day_of_month, days_in_month - 1)), totals[~in_month])
+            # Günlük özet satırları kategori-gün başına tektir: satır sayısı harcama yapılan gün sayısıdır
+            months = days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+            active_days = np.bincount(rows[~in_month], minlength=len(categories))
+            active_months = np.bincount(
+                np.unique(np.stack([rows[~in_month], months], axis=1), axis=0)[:, 0], minlength=len(categories)
+            )
+            regular = (active_months > 0) & (active_days <= REGULAR_PAYMENT_DAYS * active_months)
+        current = current.cumsum(axis=1)
+        spent = current[:, day - 1] if day else np.zeros(len(categories))
+        history_total = by_day.sum(axis=1)
+        share = np.divide(by_day[:, :day].sum(axis=1), history_total,
+                          out=np.full(len(categories), day / days_in_month), where=history_total > 0)
+        remaining = baseline * (1 - share)
+        if day < days_in_month:
+            # Düzenli ödemenin bugüne kadar beklenip ödenmemiş kısmı (ör. 5'inde ödenen kira 10'unda
+            # hâlâ yoksa) ay bitmeden beklenir; az harcanan sürekli giderler ortalamaya çekilmez
+            overdue = np.maximum(baseline * share - spent, 0)
+            remaining = remaining + np.where(regular, overdue, 0)
+        # Geçmişi olmayan kategoriler için gerçekleşen hız ay sonuna taşınır
+        expected_rest = np.where(baseline > 0, remaining, spent / day * (days_in_month - day) if day else 0)
+        # İleri tarihli kayıtlar (ör. oluşturulmuş tekrarlar) tahminin alt sınırıdır
+        projected = np.maximum(spent + expected_rest, current[:, -1])
+
+        budget = self.db.get_budget(str(year), f"{month:02d}")
         return {
-            "type": "pie",
-            "data": {
-                "labels": labels,
-                "datasets": [{
-                    "label": f"{chart_type} Dağılımı",
-                    "data": data,
-                    "backgroundColor": colors[:len(labels)],
-                    "borderColor": ["#FFFFFF"] * len(labels),
-                    "borderWidth": 1
-                }]
-            },
-            "options": {
-                "responsive": True,
-                "plugins": {
-                    "legend": {"position": "top"},
-                    "tooltip": {
-                        "enabled": True,
-                        "callbacks": {
-                            "label": """function(context) {
-                                let label = context.label || '';
-                                let value = context.parsed || 0;
-                                let total = context.dataset.data.reduce((a, b) => a + b, 0);
-                                let percentage = total ? ((value / total) * 100).toFixed(2) : 0;
-                                return `${label}: ${value.toFixed(2)} TL (${percentage}%)`;
-                            }"""
-                        }
-                    },
-                    "centerText": {
-                        "display": True,
-                        "text": f"Toplam: {total:.2f} TL"
-                    }
+            "period": period,
+            "as_of": today.isoformat(),
+            "day": day,
+            "days_in_month": days_in_month,
+            "spent": round(float(spent.sum()), 2),
+            "projected": round(float(projected.sum()), 2),
+            "budget": budget,
+            "projected_over": bool(budget) and float(projected.sum()) > budget,
+            "daily": np.round(current.sum(axis=0)[:day], 2).tolist(),
+            "categories": sorted((
+                {
+                    "category": category,
+                    "spent": round(float(spent[i]), 2),
+                    "projected": round(float(projected[i]), 2),
+                    "expected": round(float(baseline[i]), 2),
                 }
-            },
-            "plugins": [{
-                "id": "centerText",
-                "beforeDraw": """function(chart) {
-                    if (chart.options.plugins.centerText.display) {
-                        let ctx = chart.ctx;
-                        let width = chart.width;
-                        let height = chart.height;
-                        ctx.save();
-                        ctx.font = 'bold 16px Arial';
-                        ctx.textAlign = 'center';
-                        ctx.textBaseline = 'middle';
-                        ctx.fillStyle = '#FFFFFF';
-                        ctx.fillText(chart.options.plugins.centerText.text, width / 2, height / 2);
-                        ctx.restore();
-                    }
-                }"""
-            }]
-        }
\ No newline at end of file
+                for i, category in enumerate(categories)
+            ), key=lambda item: -item["projected"]),
+        }
+
+    @cached
+    def generate_chart_data(self, chart_type, year=None, month=None, start_date=None, end_date=None):
+        type_ = None if chart_type == "Both" else chart_type
+        if start_date or end_date:
+            import analytics
+            frame = self.analytics_frame(year=year, month=month, start_date=start_date, end_date=end_date)
+            category_totals = analytics.category_totals(frame, type_)
+        else:
+            category_totals = self.db.get_category_totals(type=type_, year=year, month=month)
+        return pie_chart_config(f"{chart_type} Dağılımı", category_totals)
@@ -1,10 +1,11 @@
 import customtkinter as ctk
 import webbrowser
-import json
+import math
 import os
 from datetime import datetime
-from tkcalendar import Calendar
 import logging
+import chart_renderer
+from finance_manager import RECURRENCE_FREQUENCIES
 
 # Hata günlüğünü yapılandır
 logging.basicConfig(
@@ -15,12 +16,69 @@ logging.basicConfig(
     encoding="utf-8"
 )
 
+CATEGORY_COLORS = {
+    "Maaş": "#4CAF50", "Kira": "#0288D1", "Yiyecek": "#FF9800",
+    "Eğlence": "#E91E63", "Diğer": "#757575", "Faturalar": "#2196F3",
+    "Ulaşım": "#FF5722", "Sağlık": "#009688", "Eğitim": "#673AB7",
+    "Alışveriş": "#F44336", "Yatırım": "#4DB6AC", "Borç": "#D81B60",
+    "Kredi Kartı": "#AB47BC", "Kişisel Bakım": "#26A69A", "Ev Bakımı": "#FFCA28"
+}
+
+# Sanal listedeki her satırın sabit yüksekliği (piksel)
+ROW_HEIGHT = 44
+# Listeye bir seferde veritabanından yüklenen işlem sayısı
+PAGE_SIZE = 500
+# Açıklama aramasında listelenen en fazla sonuç
+SEARCH_LIMIT = 500
+# Tanılama açıkken süresi ölçülen arayüz geri çağırmaları (çizim ve pencere oluşturma)
+INSTRUMENTED_UI_PREFIXES = ("_render", "_set_transactions", "_append_transactions", "_open_chart",
+                            "_show_budget_exceedance")
+
+
+class TransactionRow:
+    """Sanal listede yeniden kullanılan tek bir işlem satırı."""
+
+    def __init__(self, master, font, on_toggle):
+        self.transaction_id = None
+        self.frame = ctk.CTkFrame(master, corner_radius=8, fg_color="#424242", height=ROW_HEIGHT - 6)
+        self.frame.pack_propagate(False)
+        self.checkbox_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            self.frame,
+            text="",
+            width=30,
+            variable=self.checkbox_var,
+            command=lambda: on_toggle(self)
+        ).pack(side="left", padx=10)
+        self.category_label = ctk.CTkLabel(self.frame, text="", font=font, width=80, anchor="w")
+        self.category_label.pack(side="left", padx=5)
+        self.text_label = ctk.CTkLabel(self.frame, text="", font=font, anchor="w")
+        self.text_label.pack(pady=5, padx=10, fill="x")
+
+    def bind(self, transaction, selected):
+        """Satırı verilen işlemin verileriyle günceller."""
+        self.transaction_id = transaction[0]
+        type_icon = "💵" if transaction[1] == "Gelir" else "💸"
+        type_arrow = "⬆️" if transaction[1] == "Gelir" else "⬇️"
+        self.category_label.configure(
+            text=transaction[3],
+            text_color=CATEGORY_COLORS.get(transaction[3], "#FFFFFF")
+        )
+        self.text_label.configure(
+            text=f"{type_icon} {transaction[1]} {type_arrow} {transaction[2]:.2f} TL | {transaction[4]} | {transaction[5] or ''}"
+        )
+        self.checkbox_var.set(selected)
+
+
 class FinanceApp:
-    def __init__(self, root, finance_manager):
+    def __init__(self, root, finance_manager, worker=None, instrumentation=None, diagnostics_file=None):
         """Uygulamanın ana GUI sınıfı."""
         self.root = root
         self.finance_manager = finance_manager
-        self.selected_transactions = []
+        self.worker = worker
+        self.instrumentation = instrumentation
+        self.diagnostics_file = diagnostics_file or "finance_diagnostics.json"
+        self.selected_transactions = set()
         self.warning_window = None
 
         # Pencere ayarları
@@ -43,14 +101,23 @@ class FinanceApp:
 
         # UI bileşenleri
         self._create_header()
+        self._create_busy_indicator()
         self._create_budget_form()
         self._create_input_form()
         self._create_transaction_list()
         self._create_filter_and_summary()
 
+        if self.worker:
+            self.worker.on_busy_change = self._set_busy
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        if self.instrumentation:
+            self.instrumentation.instrument(
+                self, include=lambda name: name.startswith(INSTRUMENTED_UI_PREFIXES)
+            )
+            self._create_diagnostics_button()
+
         # Başlangıç güncellemeleri
         self.update_transaction_list()
-        self._check_budget_exceedance()
 
     def _create_header(self):
         """Başlık oluşturur."""
@@ -61,6 +128,114 @@ class FinanceApp:
             text_color="#FFFFFF"
         ).pack(pady=15)
 
+    def _create_busy_indicator(self):
+        """Arka plan işleri sürerken gösterilen göstergeyi oluşturur."""
+        self.busy_label = ctk.CTkLabel(
+            self.main_frame,
+            text="⏳ Yükleniyor...",
+            font=ctk.CTkFont(size=12),
+            text_color="#B0BEC5"
+        )
+
+    def _create_diagnostics_button(self):
+        """Tanılama açıkken ölçüm penceresini açan düğmeyi ekler."""
+        ctk.CTkButton(
+            self.main_frame,
+            text="🩺 Tanılama",
+            command=self.show_diagnostics,
+            corner_radius=8,
+            fg_color="#546E7A",
+            hover_color="#37474F",
+            font=ctk.CTkFont(size=12),
+            width=110
+        ).place(x=20, y=20, anchor="nw")
+
+    def show_diagnostics(self):
+        """Metot süre histogramlarını ve yavaş sorguları gösterir."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Tanılama")
+        dialog.geometry("900x600")
+        dialog.transient(self.root)
+        dialog.configure(fg_color="#212121")
+
+        textbox = ctk.CTkTextbox(dialog, font=ctk.CTkFont(family="Courier", size=12), wrap="none")
+        textbox.pack(pady=10, padx=10, fill="both", expand=True)
+
+        def refresh():
+            snapshot = self.instrumentation.snapshot()
+            lines = [f"{'Metot':<48}{'Çağrı':>7}{'Toplam ms':>12}{'Ort. ms':>10}{'p95 ms':>9}{'En çok ms':>11}{'Satır':>10}"]
+            for name, stats in snapshot["methods"].items():
+                lines.append(
+                    f"{name:<48}{stats['count']:>7}{stats['total_ms']:>12.1f}{stats['mean_ms']:>10.2f}"
+                    f"{stats['p95_ms']:>9}{stats['max_ms']:>11.1f}{stats['rows']:>10}"
+                )
+            lines.append("")
+            lines.append(f"Yavaş çağrılar (>= {snapshot['slow_ms']} ms):")
+            for slow in reversed(snapshot["slow_queries"]):
+                lines.append(f"[{slow['at']}] {slow['method']} {slow['elapsed_ms']:.1f} ms, {slow['rows']} satır")
+                for query in slow["queries"]:
+                    lines.append(f"    {query['sql'][:200]}")
+                    for step in query["plan"] or []:
+                        lines.append(f"        → {step}")
+            textbox.configure(state="normal")
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", "\n".join(lines))
+            textbox.configure(state="disabled")
+
+        def save():
+            self.instrumentation.dump(self.diagnostics_file)
+            self._show_info(f"Tanılama verisi kaydedildi: {os.path.abspath(self.diagnostics_file)}")
+
+        def reset():
+            self.instrumentation.reset()
+            refresh()
+
+        buttons = ctk.CTkFrame(dialog, fg_color="transparent")
+        buttons.pack(pady=10)
+        for text, command, color in (
+            ("🔄 Yenile", refresh, "#0288D1"),
+            ("💾 JSON Kaydet", save, "#43A047"),
+            ("🧹 Sıfırla", reset, "#FF9800"),
+            ("❌ Kapat", dialog.destroy, "#D32F2F"),
+        ):
+            ctk.CTkButton(buttons, text=text, command=command, corner_radius=8, fg_color=color,
+                          font=self.font, width=140).pack(side="left", padx=8)
+        refresh()
+
+    def _set_busy(self, busy):
+        """Meşgul göstergesini açar/kapatır."""
+        if busy:
+            self.busy_label.place(relx=1.0, x=-20, y=20, anchor="ne")
+        else:
+            self.busy_label.place_forget()
+
+    def _run_in_background(self, key, func, callback, error_callback=None):
+        """`func(finance_manager)` işini arka planda çalıştırıp sonucu `callback` ile işler.
+
+        Aynı anahtarla gelen yeni istek eskisini geçersiz kılar; worker yoksa iş
+        doğrudan çalıştırılır. Hatalar `error_callback` verilmezse
+        `_on_background_error` ile bildirilir.
+        """
+        error_callback = error_callback or self._on_background_error
+        if self.worker is None:
+            try:
+                result = func(self.finance_manager)
+            except Exception as e:
+                error_callback(e)
+                return
+            callback(result)
+            return
+        self.worker.submit(key, func, callback, error_callback)
+
+    def _on_background_error(self, error):
+        logging.error("Arka plan işi başarısız: %s", error)
+        self._show_error(str(error))
+
+    def _on_close(self):
+        """Pencere kapanırken arka plan iş parçacığını durdurur."""
+        self.worker.shutdown()
+        self.root.destroy()
+
     def _create_budget_form(self):
         """Bütçe formunu oluşturur."""
         frame = ctk.CTkFrame(self.main_frame, corner_radius=12, fg_color="#333333")
@@ -102,6 +277,20 @@ class FinanceApp:
         )
         self.budget_amount_entry.grid(row=0, column=5, padx=15, pady=10)
 
+        # Kategori: "Toplam" ayın genel bütçesi, diğerleri kategori limitleridir
+        ctk.CTkLabel(frame, text="🏷️ Kategori:", font=self.font).grid(row=1, column=0, padx=15, pady=10, sticky="w")
+        self.budget_category_var = ctk.StringVar(value="Toplam")
+        self.budget_category_menu = ctk.CTkOptionMenu(
+            frame,
+            values=["Toplam"] + self.finance_manager.get_categories(),
+            variable=self.budget_category_var,
+            corner_radius=8,
+            button_color="#0288D1",
+            button_hover_color="#01579B",
+            font=self.font
+        )
+        self.budget_category_menu.grid(row=1, column=1, padx=15, pady=10)
+
         # Mevcut bütçe
         self.budget_display = ctk.CTkLabel(
             frame,
@@ -109,7 +298,7 @@ class FinanceApp:
             font=ctk.CTkFont(size=12),
             text_color="#B0BEC5"
         )
-        self.budget_display.grid(row=1, column=0, columnspan=6, padx=15, pady=10)
+        self.budget_display.grid(row=1, column=2, columnspan=6, padx=15, pady=10)
 
         # Butonlar
         ctk.CTkButton(
@@ -138,10 +327,19 @@ class FinanceApp:
         try:
             year = self.budget_year_var.get()
             month = self.budget_month_var.get()
-            budget = self.finance_manager.get_budget(year, month)
-            self.budget_display.configure(
-                text=f"ℹ️ Mevcut Bütçe: {budget:.2f} TL" if budget else "ℹ️ Mevcut Bütçe: Tanımlı değil"
-            )
+            category = self.budget_category_var.get()
+            if category == "Toplam":
+                budget = self.finance_manager.get_budget(year, month)
+                text = f"ℹ️ Mevcut Bütçe: {budget:.2f} TL" if budget else "ℹ️ Mevcut Bütçe: Tanımlı değil"
+            else:
+                status = next(
+                    (item for item in self.finance_manager.budget_status(year, month) if item["category"] == category),
+                    {"limit": None, "spent": 0.0}
+                )
+                budget = status["limit"]
+                text = (f"ℹ️ {category} Bütçesi: {budget:.2f} TL (harcanan {status['spent']:.2f} TL)" if budget
+                        else f"ℹ️ {category} Bütçesi: Tanımlı değil")
+            self.budget_display.configure(text=text)
             self.budget_amount_entry.delete(0, "end")
             if budget:
                 self.budget_amount_entry.insert(0, f"{budget:.2f}")
@@ -156,7 +354,11 @@ class FinanceApp:
             amount = float(self.budget_amount_entry.get())
             if amount <= 0:
                 raise ValueError("Bütçe pozitif olmalı!")
-            self.finance_manager.set_budget(year, month, amount)
+            category = self.budget_category_var.get()
+            if category == "Toplam":
+                self.finance_manager.set_budget(year, month, amount)
+            else:
+                self.finance_manager.set_category_budget(year, month, category, amount)
             self.budget_amount_entry.delete(0, "end")
             self._check_budget()
             self._check_budget_exceedance()
@@ -242,6 +444,30 @@ class FinanceApp:
         )
         self.desc_entry.grid(row=1, column=4, columnspan=2, padx=15, pady=10, sticky="ew")
 
+        # Tekrar: "Yok" dışındaki seçimler işlemi tekrarlayan kural olarak kaydeder
+        ctk.CTkLabel(frame, text="🔁 Tekrarla:", font=self.font).grid(row=2, column=0, padx=15, pady=10, sticky="w")
+        self.recurrence_var = ctk.StringVar(value="Yok")
+        ctk.CTkOptionMenu(
+            frame,
+            values=["Yok"] + list(RECURRENCE_FREQUENCIES.values()),
+            variable=self.recurrence_var,
+            corner_radius=8,
+            button_color="#0288D1",
+            button_hover_color="#01579B",
+            font=self.font
+        ).grid(row=2, column=1, padx=15, pady=10)
+
+        ctk.CTkButton(
+            frame,
+            text="🔁 Tekrarlar",
+            command=self.show_recurring_rules,
+            corner_radius=8,
+            fg_color="#7B1FA2",
+            hover_color="#4A148C",
+            font=self.font,
+            width=140
+        ).grid(row=2, column=2, columnspan=2, padx=15, pady=10, sticky="w")
+
         # Ekle butonu
         ctk.CTkButton(
             frame,
@@ -256,6 +482,9 @@ class FinanceApp:
 
     def _open_calendar(self):
         """Takvim açar."""
+        # tkcalendar (ve babel) yalnızca takvim ilk açıldığında yüklenir
+        from tkcalendar import Calendar
+
         top = ctk.CTkToplevel(self.root)
         top.title("Tarih Seç")
         top.geometry("300x300")
@@ -293,10 +522,37 @@ class FinanceApp:
         self.list_frame = ctk.CTkFrame(self.main_frame, corner_radius=12, fg_color="#333333")
         self.list_frame.pack(pady=10, padx=10, fill="both", expand=True)
 
-        self.scrollable_frame = ctk.CTkScrollableFrame(self.list_frame, corner_radius=10, fg_color="#2B2B2B")
+        # Sanal liste: yalnızca görünen satırlar kadar widget tutulur ve kaydırıldıkça yeniden bağlanır
+        self.scrollable_frame = ctk.CTkFrame(self.list_frame, corner_radius=10, fg_color="#2B2B2B")
         self.scrollable_frame.pack(pady=10, padx=10, fill="both", expand=True)
-
-        self.transaction_frames = []
+        self.list_scrollbar = ctk.CTkScrollbar(self.scrollable_frame, command=self._on_list_scroll)
+        self.list_scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        self.rows_container = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        self.rows_container.pack(side="left", fill="both", expand=True)
+
+        self.row_font = ctk.CTkFont(size=12)
+        self.transaction_rows = []
+        self.transactions = []
+        self.list_offset = 0
+        self.list_filters = {}
+        self.list_cursor = None
+        self.list_total = 0
+        self.list_generation = 0
+        self.loading_page = False
+
+        self.rows_container.bind("<Configure>", self._on_list_resize)
+        for widget in (self.scrollable_frame, self.rows_container):
+            widget.bind("<MouseWheel>", self._on_list_mousewheel)
+            widget.bind("<Button-4>", self._on_list_mousewheel)
+            widget.bind("<Button-5>", self._on_list_mousewheel)
+
+        self.list_count_label = ctk.CTkLabel(
+            self.list_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#B0BEC5"
+        )
+        self.list_count_label.pack()
 
         ctk.CTkButton(
             self.list_frame,
@@ -389,19 +645,43 @@ class FinanceApp:
             font=ctk.CTkFont(family="Roboto", size=14, weight="bold"),
             width=160
         ).grid(row=0, column=8, padx=15, pady=10)
+        ctk.CTkButton(
+            frame,
+            text="🧮 Ay × Kategori",
+            command=self.show_pivot,
+            corner_radius=8,
+            fg_color="#43A047",
+            hover_color="#2E7D32",
+            font=ctk.CTkFont(family="Roboto", size=14, weight="bold"),
+            width=160
+        ).grid(row=1, column=6, padx=15, pady=10)
+
+        # Açıklama araması; seçili filtrelerle birlikte uygulanır
+        ctk.CTkLabel(frame, text="🔍 Ara:", font=self.font).grid(row=1, column=0, padx=15, pady=10, sticky="w")
+        self.search_entry = ctk.CTkEntry(
+            frame,
+            corner_radius=8,
+            placeholder_text="Açıklamada ara...",
+            font=self.font
+        )
+        self.search_entry.grid(row=1, column=1, columnspan=4, padx=15, pady=10, sticky="ew")
+        self.search_entry.bind("<Return>", self.update_transaction_list)
+        ctk.CTkButton(
+            frame,
+            text="Ara",
+            command=self.update_transaction_list,
+            corner_radius=8,
+            fg_color="#0288D1",
+            hover_color="#01579B",
+            font=self.font,
+            width=80
+        ).grid(row=1, column=5, padx=15, pady=10)
 
     def get_available_years(self):
         """Mevcut yılları alır."""
-        transactions = self.finance_manager.get_transactions()
-        years = set()
-        for t in transactions:
-            try:
-                date = datetime.strptime(t[4].split(" ")[0], "%Y-%m-%d")
-                years.add(date.year)
-            except ValueError:
-                continue
+        years = set(self.finance_manager.get_available_years())
         current_year = datetime.now().year
-        return sorted([str(y) for y in set(years).union(set(range(current_year, current_year + 5)))])
+        return sorted([str(y) for y in years.union(set(range(current_year, current_year + 5)))])
 
     def add_transaction(self):
         """İşlem ekler."""
@@ -418,82 +698,211 @@ class FinanceApp:
             except ValueError:
                 raise ValueError("Geçerli bir tarih girin (YYYY-MM-DD)!")
 
-            self.finance_manager.add_transaction(type_, amount, category, date, description)
+            recurrence = self.recurrence_var.get()
+            if recurrence == "Yok":
+                self.finance_manager.add_transaction(type_, amount, category, date, description)
+                message = "İşlem başarıyla eklendi."
+            else:
+                frequency = next(code for code, label in RECURRENCE_FREQUENCIES.items() if label == recurrence)
+                self.finance_manager.add_recurring_rule(type_, amount, category, date, frequency, description=description)
+                # Başlangıç tarihi geçmişteyse bugüne kadarki tekrarlar da hemen oluşturulur
+                created = self.finance_manager.materialize_recurring()
+                message = f"{recurrence} tekrar kaydedildi, {created} işlem oluşturuldu."
+                self.recurrence_var.set("Yok")
             self.update_transaction_list()
             self._update_category_menu()
             self._update_year_menu()
             self.amount_entry.delete(0, "end")
             self.desc_entry.delete(0, "end")
-            self._check_budget_exceedance()
-            self._show_info("İşlem başarıyla eklendi.")
+            self._show_info(message)
         except ValueError as e:
             self._show_error(str(e))
 
+    def show_recurring_rules(self):
+        """Tekrarlayan işlem kurallarını listeler; kural silme ve vadesi gelenleri oluşturma sağlar."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Tekrarlayan İşlemler")
+        dialog.geometry("760x420")
+        dialog.transient(self.root)
+        dialog.configure(fg_color="#212121")
+
+        rules_frame = ctk.CTkScrollableFrame(dialog, fg_color="#333333", corner_radius=12)
+        rules_frame.pack(pady=10, padx=10, fill="both", expand=True)
+
+        def refresh():
+            for widget in rules_frame.winfo_children():
+                widget.destroy()
+            rules = self.finance_manager.get_recurring_rules()
+            if not rules:
+                ctk.CTkLabel(rules_frame, text="Tekrarlayan işlem yok.", font=self.font).pack(pady=20)
+            for (id_, type_, amount, category, description, frequency, interval,
+                 start_date, end_date, last_date) in rules:
+                row = ctk.CTkFrame(rules_frame, fg_color="transparent")
+                row.pack(fill="x", pady=2)
+                every = RECURRENCE_FREQUENCIES[frequency] if interval == 1 else f"{interval} x {RECURRENCE_FREQUENCIES[frequency]}"
+                text = (f"{type_} | {category} | {amount:.2f} TL | {every} | {start_date} → {end_date or '…'}"
+                        f" | son: {last_date or '-'}" + (f" | {description}" if description else ""))
+                ctk.CTkLabel(row, text=text, font=self.font, anchor="w",
+                             text_color="#4CAF50" if type_ == "Gelir" else "#EF5350").pack(side="left", padx=10)
+                ctk.CTkButton(row, text="🗑", width=40, corner_radius=8, fg_color="#D32F2F", hover_color="#B71C1C",
+                              command=lambda id_=id_: delete(id_)).pack(side="right", padx=10)
+
+        def delete(id_):
+            self.finance_manager.delete_recurring_rule(id_)
+            refresh()
+
+        def materialize():
+            created = self.finance_manager.materialize_recurring()
+            refresh()
+            if created:
+                self.update_transaction_list()
+                self._update_year_menu()
+            self._show_info(f"{created} işlem oluşturuldu.")
+
+        buttons = ctk.CTkFrame(dialog, fg_color="transparent")
+        buttons.pack(pady=10)
+        for text, command, color in (
+            ("▶ Vadesi Gelenleri Oluştur", materialize, "#43A047"),
+            ("❌ Kapat", dialog.destroy, "#D32F2F"),
+        ):
+            ctk.CTkButton(buttons, text=text, command=command, corner_radius=8, fg_color=color,
+                          font=self.font, width=200).pack(side="left", padx=8)
+        refresh()
+
     def update_transaction_list(self, *args):
         """İşlem listesini günceller."""
-        for frame in self.transaction_frames:
-            frame.destroy()
-        self.transaction_frames.clear()
-        self.selected_transactions.clear()
-
         category = self.filter_category_var.get() if self.filter_category_var.get() != "Tümü" else None
         year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
         month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
-        transactions = self.finance_manager.get_transactions(category=category, year=year, month=month)
-
-        category_colors = {
-            "Maaş": "#4CAF50", "Kira": "#0288D1", "Yiyecek": "#FF9800",
-            "Eğlence": "#E91E63", "Diğer": "#757575", "Faturalar": "#2196F3",
-            "Ulaşım": "#FF5722", "Sağlık": "#009688", "Eğitim": "#673AB7",
-            "Alışveriş": "#F44336", "Yatırım": "#4DB6AC", "Borç": "#D81B60",
-            "Kredi Kartı": "#AB47BC", "Kişisel Bakım": "#26A69A", "Ev Bakımı": "#FFCA28"
-        }
-
-        for t in transactions:
-            frame = ctk.CTkFrame(self.scrollable_frame, corner_radius=8, fg_color="#424242")
-            frame.pack(pady=5, padx=10, fill="x")
-
-            checkbox_var = ctk.BooleanVar(value=False)
-            ctk.CTkCheckBox(
-                frame,
-                text="",
-                variable=checkbox_var,
-                command=lambda id=t[0], var=checkbox_var: self._toggle_selection(id, var)
-            ).pack(side="left", padx=10)
-
-            # Kategori etiketi
-            ctk.CTkLabel(
-                frame,
-                text=t[3],
-                font=ctk.CTkFont(size=12),
-                text_color=category_colors.get(t[3], "#FFFFFF"),
-                width=80,
-                anchor="w"
-            ).pack(side="left", padx=5)
-
-            # İşlem satırı: 💵 Gelir ⬆️ veya 💸 Gider ⬇️
-            type_icon = "💵" if t[1] == "Gelir" else "💸"
-            type_arrow = "⬆️" if t[1] == "Gelir" else "⬇️"
-            text = f"{type_icon} {t[1]} {type_arrow} {t[2]:.2f} TL | {t[4]} | {t[5] or ''}"
-            ctk.CTkLabel(
-                frame,
-                text=text,
-                font=ctk.CTkFont(size=12),
-                anchor="w"
-            ).pack(pady=5, padx=10, fill="x")
+        filters = {"category": category, "year": year, "month": month}
+        query = self.search_entry.get().strip()
+        if query:
+            # Arama sonuçları tek sayfadır; sonraki sayfa istenmez
+            self._run_in_background(
+                "transactions",
+                lambda fm: fm.search(query, limit=SEARCH_LIMIT, **filters),
+                lambda rows: self._set_transactions(filters, (rows, None, len(rows)))
+            )
+            return
+        self._run_in_background(
+            "transactions",
+            lambda fm: fm.get_transactions_page(limit=PAGE_SIZE, with_total=True, **filters),
+            lambda page: self._set_transactions(filters, page)
+        )
 
-            self.transaction_frames.append(frame)
+    def _set_transactions(self, filters, page):
+        """Yüklenen ilk sayfayı listeye bağlar."""
+        transactions, cursor, total = page
+        self.selected_transactions.clear()
+        self.list_generation += 1
+        self.list_filters = filters
+        self.transactions = list(transactions)
+        self.list_cursor = cursor
+        self.list_total = total
+        self.loading_page = False
+        self.list_offset = 0
+        self._render_visible_rows()
 
         self._check_budget_exceedance()
 
-    def _toggle_selection(self, id_, var):
+    def _load_next_page(self):
+        """Liste sonuna yaklaşıldığında sonraki sayfayı yükler."""
+        if self.loading_page or self.list_cursor is None:
+            return
+        self.loading_page = True
+        generation = self.list_generation
+        filters = self.list_filters
+        cursor = self.list_cursor
+        self._run_in_background(
+            "transactions_page",
+            lambda fm: fm.get_transactions_page(limit=PAGE_SIZE, after=cursor, **filters),
+            lambda page: self._append_transactions(generation, page),
+            lambda error: self._on_page_error(generation, error)
+        )
+
+    def _on_page_error(self, generation, error):
+        """Sayfa yüklenemezse kaydırmayla yeniden denenebilsin diye bayrağı bırakır."""
+        if generation == self.list_generation:
+            self.loading_page = False
+        self._on_background_error(error)
+
+    def _append_transactions(self, generation, page):
+        """Sonraki sayfayı listeye ekler; filtre değiştiyse sonucu yok sayar."""
+        if generation != self.list_generation:
+            return
+        transactions, cursor, _ = page
+        self.transactions.extend(transactions)
+        self.list_cursor = cursor
+        self.loading_page = False
+        self._render_visible_rows()
+
+    def _on_list_resize(self, event):
+        """Görünür alan değiştiğinde satır havuzunu yeniden boyutlandırır."""
+        needed = max(1, math.ceil(event.height / ROW_HEIGHT))
+        while len(self.transaction_rows) < needed:
+            row = TransactionRow(self.rows_container, self.row_font, self._toggle_selection)
+            for widget in (row.frame, row.category_label, row.text_label):
+                widget.bind("<MouseWheel>", self._on_list_mousewheel)
+                widget.bind("<Button-4>", self._on_list_mousewheel)
+                widget.bind("<Button-5>", self._on_list_mousewheel)
+            self.transaction_rows.append(row)
+        while len(self.transaction_rows) > needed:
+            self.transaction_rows.pop().frame.destroy()
+        self._render_visible_rows()
+
+    def _render_visible_rows(self):
+        """Havuzdaki satırları görünen işlemlere bağlar."""
+        visible = len(self.transaction_rows)
+        total = len(self.transactions)
+        self.list_offset = max(0, min(self.list_offset, total - visible))
+        for index, row in enumerate(self.transaction_rows):
+            position = self.list_offset + index
+            if position < total:
+                transaction = self.transactions[position]
+                row.bind(transaction, transaction[0] in self.selected_transactions)
+                if not row.frame.winfo_manager():
+                    row.frame.pack(pady=3, padx=10, fill="x")
+            else:
+                row.transaction_id = None
+                row.frame.pack_forget()
+        if total:
+            self.list_scrollbar.set(self.list_offset / total, min(1.0, (self.list_offset + visible) / total))
+        else:
+            self.list_scrollbar.set(0.0, 1.0)
+        self.list_count_label.configure(text=f"{total} / {self.list_total} işlem yüklendi")
+        # Yüklenen satırların sonuna yaklaşıldıysa sonraki sayfa arka planda getirilir
+        if self.list_offset + 2 * visible >= total:
+            self._load_next_page()
+
+    def _scroll_list_to(self, offset):
+        offset = max(0, min(offset, len(self.transactions) - len(self.transaction_rows)))
+        if offset != self.list_offset:
+            self.list_offset = offset
+            self._render_visible_rows()
+
+    def _on_list_scroll(self, action, value, unit=None):
+        """Kaydırma çubuğu komutlarını işler."""
+        if action == "moveto":
+            self._scroll_list_to(int(float(value) * len(self.transactions)))
+        elif action == "scroll":
+            step = len(self.transaction_rows) if unit == "pages" else 1
+            self._scroll_list_to(self.list_offset + int(value) * step)
+
+    def _on_list_mousewheel(self, event):
+        """Fare tekerleği ile listeyi kaydırır."""
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self._scroll_list_to(self.list_offset - 3)
+        else:
+            self._scroll_list_to(self.list_offset + 3)
+
+    def _toggle_selection(self, row):
         """İşlem seçimini günceller."""
-        if var.get():
-            if id_ not in self.selected_transactions:
-                self.selected_transactions.append(id_)
+        if row.transaction_id is None:
+            return
+        if row.checkbox_var.get():
+            self.selected_transactions.add(row.transaction_id)
         else:
-            if id_ in self.selected_transactions:
-                self.selected_transactions.remove(id_)
+            self.selected_transactions.discard(row.transaction_id)
 
     def _update_category_menu(self):
         """Kategori menüsünü günceller."""
@@ -501,6 +910,7 @@ class FinanceApp:
         self.category_menu.configure(values=self.finance_manager.get_categories())
         self.filter_category_var.set("Tümü")
         self.category_menu.configure(values=categories)
+        self.budget_category_menu.configure(values=["Toplam"] + self.finance_manager.get_categories())
 
     def _update_year_menu(self):
         """Yıl menüsünü günceller."""
@@ -513,17 +923,17 @@ class FinanceApp:
         if not self.selected_transactions:
             self._show_warning("Silmek için işlem seçin!")
             return
-        for id_ in self.selected_transactions:
-            self.finance_manager.delete_transaction(id_)
+        self.finance_manager.delete_transactions(self.selected_transactions)
         self.update_transaction_list()
-        self._check_budget_exceedance()
 
     def show_summary(self):
         """Özet tablosu gösterir."""
         year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
         month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
-        summary = self.finance_manager.generate_summary(year, month)
+        self._run_in_background("summary", lambda fm: fm.generate_summary(year, month), self._render_summary)
 
+    def _render_summary(self, summary):
+        """Özet tablosu penceresini oluşturur."""
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Finansal Özet")
         dialog.geometry("600x400")
@@ -582,8 +992,12 @@ class FinanceApp:
         """Bütçe raporunu gösterir."""
         year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
         month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
-        report_data = self.finance_manager.get_budget_report(year, month)
+        self._run_in_background(
+            "budget_report", lambda fm: fm.get_budget_report(year, month), self._render_budget_report
+        )
 
+    def _render_budget_report(self, report_data):
+        """Bütçe raporu penceresini oluşturur."""
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Bütçe Raporu")
         dialog.geometry("600x400")
@@ -643,11 +1057,74 @@ class FinanceApp:
             font=self.font
         ).pack(pady=10)
 
+    def show_pivot(self):
+        """Ay × kategori gider tablosunu gösterir."""
+        category = self.filter_category_var.get() if self.filter_category_var.get() != "Tümü" else None
+        year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
+        month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
+        self._run_in_background(
+            "pivot",
+            lambda fm: fm.pivot(
+                ("period",), ("category",), ("sum", "count"),
+                type="Gider", category=category, year=year, month=month
+            ),
+            self._render_pivot
+        )
+
+    def _render_pivot(self, pivot):
+        """Pivot tablo penceresini oluşturur."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Ay × Kategori Giderleri")
+        dialog.geometry("900x500")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.configure(fg_color="#212121")
+
+        frame = ctk.CTkScrollableFrame(dialog, corner_radius=12, fg_color="#333333", orientation="horizontal")
+        frame.pack(pady=10, padx=10, fill="both", expand=True)
+
+        header_font = ctk.CTkFont(size=12, weight="bold")
+        cell_font = ctk.CTkFont(size=12)
+        if pivot["rows"]:
+            ctk.CTkLabel(frame, text="Dönem", font=header_font, text_color="#FFFFFF").grid(row=0, column=0, padx=10, pady=5)
+            for col, (category,) in enumerate(pivot["cols"], 1):
+                ctk.CTkLabel(
+                    frame,
+                    text=category,
+                    font=header_font,
+                    text_color=CATEGORY_COLORS.get(category, "#FFFFFF")
+                ).grid(row=0, column=col, padx=10, pady=5)
+            sums = pivot["values"]["sum"]
+            counts = pivot["values"]["count"]
+            for row, (period,) in enumerate(pivot["rows"], 1):
+                ctk.CTkLabel(frame, text=period, font=cell_font).grid(row=row, column=0, padx=10, pady=2)
+                for col in range(len(pivot["cols"])):
+                    total = sums[row - 1][col]
+                    text = f"{total:.2f} ({counts[row - 1][col]})" if total is not None else "-"
+                    ctk.CTkLabel(frame, text=text, font=cell_font).grid(row=row, column=col + 1, padx=10, pady=2)
+        else:
+            ctk.CTkLabel(
+                frame,
+                text="Veri bulunamadı.",
+                font=cell_font,
+                text_color="#B0BEC5"
+            ).grid(row=1, column=0, pady=10)
+
+        ctk.CTkButton(
+            dialog,
+            text="❌ Kapat",
+            command=dialog.destroy,
+            corner_radius=8,
+            fg_color="#D32F2F",
+            hover_color="#B71C1C",
+            font=self.font
+        ).pack(pady=10)
+
     def show_chart_dialog(self):
         """Grafik seçimi penceresi açar."""
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Grafik Türü Seç")
-        dialog.geometry("400x250")
+        dialog.geometry("400x310")
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.configure(fg_color="#212121")
@@ -686,86 +1163,124 @@ class FinanceApp:
             hover_color="#2E7D32",
             font=self.font
         ).pack(pady=10)
+        ctk.CTkButton(
+            dialog,
+            text="🗂 Aylık Pano",
+            command=self._show_dashboard,
+            corner_radius=8,
+            fg_color="#0288D1",
+            hover_color="#01579B",
+            font=self.font
+        ).pack(pady=10)
 
     def _show_chart(self, chart_type):
         """Grafiği tarayıcıda açar."""
+        year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
+        month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
+
+        def render(fm):
+            # Sayfa da arka planda yazılır; veri değişmediyse mevcut dosya kullanılır
+            path, _ = chart_renderer.render_chart(
+                fm.generate_chart_data(chart_type, year, month), f"{chart_type} Dağılımı"
+            )
+            return path
+
+        self._run_in_background("chart", render, self._open_chart)
+
+    def _show_dashboard(self):
+        """Seçili yılın tüm grafiklerini tek sayfada açar."""
+        year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
+        month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
+
+        def render(fm):
+            path, _ = chart_renderer.render_dashboard(fm.generate_dashboard(year, month))
+            return path
+
+        self._run_in_background("chart", render, self._open_chart)
+
+    def _open_chart(self, chart_file):
+        """Hazırlanan grafik sayfasını tarayıcıda açar."""
         try:
-            chart_file = "chart.html"
-            if os.path.exists(chart_file):
-                os.remove(chart_file)
-
-            year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else None
-            month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else None
-            chart_data = self.finance_manager.generate_chart_data(chart_type, year, month)
-            with open(chart_file, "w", encoding="utf-8") as f:
-                f.write(f"""
-                <html>
-                <head>
-                    <meta charset="UTF-8">
-                    <title>{chart_type} Dağılımı</title>
-                    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.2/dist/chart.umd.min.js"></script>
-                    <style>
-                        #myChart {{ max-width: 600px; max-height: 400px; margin: 20px auto; }}
-                        #error {{ color: red; text-align: center; margin-top: 20px; }}
-                    </style>
-                </head>
-                <body>
-                    <canvas id="myChart"></canvas>
-                    <div id="error" style="display: none;">Grafik yüklenemedi.</div>
-                    <script>
-                        try {{
-                            const ctx = document.getElementById('myChart').getContext('2d');
-                            new Chart(ctx, {json.dumps(chart_data, ensure_ascii=False)});
-                        }} catch (e) {{
-                            document.getElementById('error').style.display = 'block';
-                            console.error('Grafik hatası:', e);
-                        }}
-                    </script>
-                </body>
-                </html>
-                """)
-            webbrowser.open(f"file://{os.path.abspath(chart_file)}")
+            webbrowser.open(f"file://{chart_file}")
         except Exception as e:
-            self._show_error(f"Grafik oluşturulamadı: {str(e)}")
+            self._show_error(f"Grafik açılamadı: {str(e)}")
 
     def _check_budget_exceedance(self):
-        """Bütçe aşımını kontrol eder."""
+        """Genel ve kategori bütçelerinin aşımını ve ay sonu tahminini kontrol eder."""
+        year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else str(datetime.now().year)
+        month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else datetime.now().strftime("%m")
+
+        def load(fm):
+            budget = fm.get_budget(year, month)
+            # Tüm kategorilerin limit ve giderleri tek sorguda gelir; toplam gider de buradan çıkar
+            status = fm.budget_status(year, month)
+            limits = [item for item in status if item["limit"]]
+            if not budget and not limits:
+                return budget, 0.0, None, limits
+            # Ay sonu tahmini yalnızca henüz bitmemiş ay için anlamlıdır
+            forecast = fm.forecast_month(year, month) if f"{year}-{month}" >= datetime.now().strftime("%Y-%m") else None
+            total_expense = sum(item["spent"] for item in status)
+            return budget, total_expense, forecast, limits
+
+        self._run_in_background(
+            "budget_exceedance", load, lambda result: self._show_budget_exceedance(year, month, *result)
+        )
+
+    def _show_budget_exceedance(self, year, month, budget, total_expense, forecast=None, limits=()):
+        """Genel ya da kategori bütçesi aşıldıysa veya ay sonunda aşılması bekleniyorsa uyarı gösterir."""
         if self.warning_window:
             self.warning_window.destroy()
             self.warning_window = None
 
-        year = self.filter_year_var.get() if self.filter_year_var.get() != "Tümü" else str(datetime.now().year)
-        month = self.filter_month_var.get() if self.filter_month_var.get() != "Tümü" else datetime.now().strftime("%m")
-        budget = self.finance_manager.get_budget(year, month)
-        if not budget:
+        projected = {item["category"]: item["projected"] for item in forecast["categories"]} if forecast else {}
+        exceeded = []
+        expected = []
+        if budget and total_expense > budget:
+            exceeded.append(f"{year}-{month} bütçesi aşıldı! ({total_expense:.2f} TL / {budget:.2f} TL)")
+        elif budget and forecast and forecast["projected"] > budget:
+            expected.append(f"{year}-{month} bütçesi: tahmini {forecast['projected']:.2f} TL / {budget:.2f} TL "
+                            f"(şu ana kadar {total_expense:.2f} TL)")
+        for item in limits:
+            if item["spent"] > item["limit"]:
+                exceeded.append(f"{item['category']}: {item['spent']:.2f} TL / {item['limit']:.2f} TL")
+            elif projected.get(item["category"], 0.0) > item["limit"]:
+                expected.append(f"{item['category']}: tahmini {projected[item['category']]:.2f} TL / "
+                                f"{item['limit']:.2f} TL")
+        if not exceeded and not expected:
             return
 
-        transactions = self.finance_manager.get_transactions(type="Gider", year=year, month=month)
-        total_expense = sum(t[2] for t in transactions)
-        if total_expense > budget:
-            self.warning_window = ctk.CTkToplevel(self.root)
-            self.warning_window.title("Dikkat")
-            self.warning_window.geometry("400x150")
-            self.warning_window.transient(self.root)
-            self.warning_window.grab_set()
-            self.warning_window.configure(fg_color="#212121")
+        lines = []
+        if exceeded:
+            lines += ["⚠️ UYARI: Bütçe aşıldı:"] + exceeded
+        if expected:
+            lines += ["⚠️ Bu hızla ay sonunda aşılacak:"] + expected
+        text = "\n".join(lines)
+        color = "#EF5350" if exceeded else "#FFCA28"
+
+        self.warning_window = ctk.CTkToplevel(self.root)
+        self.warning_window.title("Dikkat")
+        self.warning_window.geometry(f"520x{120 + 22 * len(lines)}")
+        self.warning_window.transient(self.root)
+        self.warning_window.grab_set()
+        self.warning_window.configure(fg_color="#212121")
 
-            ctk.CTkLabel(
-                self.warning_window,
-                text=f"⚠️ UYARI: {year}-{month} bütçesi aşıldı! ({total_expense:.2f} TL / {budget:.2f} TL)",
-                text_color="#EF5350",
-                font=ctk.CTkFont(size=14, weight="bold")
-            ).pack(pady=20)
-
-            ctk.CTkButton(
-                self.warning_window,
-                text="✔️ Tamam",
-                command=self.warning_window.destroy,
-                corner_radius=8,
-                fg_color="#43A047",
-                hover_color="#2E7D32",
-                font=self.font
-            ).pack(pady=10)
+        ctk.CTkLabel(
+            self.warning_window,
+            text=text,
+            text_color=color,
+            wraplength=480,
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(pady=20)
+
+        ctk.CTkButton(
+            self.warning_window,
+            text="✔️ Tamam",
+            command=self.warning_window.destroy,
+            corner_radius=8,
+            fg_color="#43A047",
+            hover_color="#2E7D32",
+            font=self.font
+        ).pack(pady=10)
 
     def _show_error(self, message):
         """Hata mesajı gösterir."""
@@ -0,0 +1,182 @@
+"""Banka ekstrelerini (CSV / OFX) toplu olarak içe aktarır.
+
+Kullanım:
+    python importer.py ekstre.csv
+    python importer.py ekstre.ofx --default-category Faturalar
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+import time
+from database import CONNECTION_PROFILES, Database
+from finance_manager import FinanceManager
+
+# CSV başlıkları için kabul edilen Türkçe/İngilizce adlar
+CSV_COLUMNS = {
+    "type": ("type", "tür", "tur", "işlem türü"),
+    "amount": ("amount", "miktar", "tutar"),
+    "category": ("category", "kategori"),
+    "date": ("date", "tarih", "işlem tarihi"),
+    "description": ("description", "açıklama", "aciklama", "memo"),
+}
+
+OFX_FIELD = re.compile(r"<(TRNTYPE|DTPOSTED|TRNAMT|NAME|MEMO)>([^<\r\n]*)", re.IGNORECASE)
+
+
+AMOUNT_PATTERN = re.compile(r"[+-]?\d+")
+
+
+def _group_thousands(integer, separator, text):
+    """Binlik ayıracıyla yazılmış tam sayı kısmını doğrulayıp ayıraçsız döndürür."""
+    sign = integer[:1] if integer[:1] in "+-" else ""
+    groups = integer[len(sign):].split(separator)
+    if not (1 <= len(groups[0]) <= 3 and all(len(group) == 3 for group in groups[1:])):
+        raise ValueError(f"Geçersiz tutar: {text}")
+    return sign + "".join(groups)
+
+
+def parse_amount(value):
+    """'1.234,56', '1,234.56', '-1234.56' gibi tutarları sayıya çevirir.
+
+    Hem ',' hem '.' varsa sondaki ondalık ayıracıdır. Tek bir ayıraç ve
+    ardından tam üç hane varsa ('1,234' / '1.234') binlik mi ondalık mı
+    olduğu anlaşılamadığından tutar reddedilir.
+    """
+    text = str(value).strip().replace(" ", "").replace("TL", "")
+    last = max(text.rfind(","), text.rfind("."))
+    if last == -1:
+        integer, fraction = text, ""
+    else:
+        decimal, thousands = text[last], "." if text[last] == "," else ","
+        integer, fraction = text[:last], text[last + 1:]
+        if thousands in fraction:
+            raise ValueError(f"Geçersiz tutar: {value}")
+        if decimal in integer:
+            # Aynı ayıraç birden çok kez geçiyorsa binlik ayıracıdır ('1.234.567')
+            integer, fraction = _group_thousands(text, decimal, value), ""
+        elif thousands in integer:
+            integer = _group_thousands(integer, thousands, value)
+        elif len(fraction) == 3 and 1 <= len(integer.lstrip("+-")) <= 3 and not integer.lstrip("+-").startswith("0"):
+            raise ValueError(f"Belirsiz tutar: {value} (binlik ayıracı mı, ondalık mı?)")
+    if not AMOUNT_PATTERN.fullmatch(integer) or (fraction and not fraction.isdigit()):
+        raise ValueError(f"Geçersiz tutar: {value}")
+    return float(f"{integer}.{fraction}" if fraction else integer)
+
+
+def _signed_row(amount, category, date, description):
+    """İşaretli tutardan tür çıkarır: negatifler gider, pozitifler gelirdir."""
+    try:
+        amount = parse_amount(amount)
+    except ValueError:
+        return None, amount, category, date, description
+    return ("Gider" if amount < 0 else "Gelir"), abs(amount), category, date, description
+
+
+def read_csv(path, default_category="Diğer", delimiter=None):
+    """CSV satırlarını (type, amount, category, date, description) olarak sırayla üretir.
+
+    Dosyanın tamamı belleğe alınmaz.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if delimiter is None:
+            sample = f.read(4096)
+            f.seek(0)
+            delimiter = ";" if sample.count(";") > sample.count(",") else ","
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [h.strip().lower() for h in next(reader, [])]
+        index = {}
+        for field, names in CSV_COLUMNS.items():
+            for i, name in enumerate(header):
+                if name in names:
+                    index[field] = i
+                    break
+        if "amount" not in index or "date" not in index:
+            raise ValueError("CSV dosyasında en azından tarih ve tutar sütunları olmalı!")
+
+        width = max(index.values()) + 1
+        type_i = index.get("type")
+        amount_i = index["amount"]
+        category_i = index.get("category")
+        date_i = index["date"]
+        description_i = index.get("description")
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            category = (row[category_i].strip() if category_i is not None else "") or default_category
+            description = row[description_i].strip() if description_i is not None else ""
+            date = row[date_i].strip()
+            try:
+                amount = parse_amount(row[amount_i])
+            except ValueError:
+                yield None, row[amount_i], category, date, description
+                continue
+            if type_i is not None:
+                yield row[type_i].strip(), abs(amount), category, date, description
+            else:
+                # Tür sütunu yoksa tutarın işaretine bakılır
+                yield ("Gider" if amount < 0 else "Gelir"), abs(amount), category, date, description
+
+
+def read_ofx(path, default_category="Diğer"):
+    """OFX/QFX dosyasındaki <STMTTRN> kayıtlarını sırayla üretir."""
+    fields = {}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            upper = line.upper()
+            if "<STMTTRN>" in upper:
+                fields = {}
+            for name, value in OFX_FIELD.findall(line):
+                fields[name.upper()] = value.strip()
+            if "</STMTTRN>" in upper:
+                posted = fields.get("DTPOSTED", "")
+                date = f"{posted[:4]}-{posted[4:6]}-{posted[6:8]}" if len(posted) >= 8 else posted
+                description = fields.get("NAME") or fields.get("MEMO") or ""
+                yield _signed_row(fields.get("TRNAMT", ""), default_category, date, description)
+                fields = {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banka ekstresini içe aktarır")
+    parser.add_argument("path", help="CSV veya OFX dosyası")
+    parser.add_argument("--format", choices=["csv", "ofx"], help="Dosya biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--db", default="finance.db", help="Veritabanı dosyası")
+    parser.add_argument("--db-profile", choices=sorted(CONNECTION_PROFILES), default="default",
+                        help="SQLite bağlantı profili")
+    parser.add_argument("--default-category", default="Diğer", help="Kategorisi olmayan satırlar için kategori")
+    parser.add_argument("--delimiter", help="CSV ayırıcısı (varsayılan: otomatik)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Doğrulama/ekleme parça boyutu")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("ofx" if os.path.splitext(args.path)[1].lower() in (".ofx", ".qfx") else "csv")
+    if fmt == "ofx":
+        rows = read_ofx(args.path, args.default_category)
+    else:
+        rows = read_csv(args.path, args.default_category, args.delimiter)
+
+    rejected = 0
+
+    def report_rejected(line_no, row, reason):
+        nonlocal rejected
+        rejected += 1
+        print(f"Satır {line_no} reddedildi: {reason}", file=sys.stderr)
+
+    db = Database(args.db, profile=args.db_profile)
+    finance_manager = FinanceManager(db)
+    started = time.perf_counter()
+    try:
+        inserted, _ = finance_manager.import_transactions(
+            rows, chunk_size=args.chunk_size, on_reject=report_rejected
+        )
+    finally:
+        db.close()
+    print(f"{inserted} işlem {time.perf_counter() - started:.2f} sn içinde içe aktarıldı, {rejected} satır reddedildi.")
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
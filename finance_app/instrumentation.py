@@ -0,0 +1,190 @@
+"""İsteğe bağlı çalışma zamanı ölçümleri: metot süreleri, SQL metinleri ve sorgu planları.
+
+Yalnızca `--instrument` ile açıldığında nesnelerin metotları sarmalanır;
+kapalıyken hiçbir sarmalayıcı kurulmaz, yani ek maliyet yoktur. SQL
+metinleri sqlite3 `set_trace_callback` ile yakalanır; eşiği aşan Database
+çağrılarındaki sorgular için EXPLAIN QUERY PLAN çıktısı saklanır.
+"""
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import deque
+
+# Histogram kova üst sınırları (ms); son kova bunların üzerini tutar
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+PLANNABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+# Bir çağrı için saklanan en fazla SQL metni; executemany her satır için iz bırakır
+MAX_STATEMENTS_PER_CALL = 20
+
+
+class MethodStats:
+    __slots__ = ("count", "total", "max", "rows", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, elapsed_ms, rows):
+        self.count += 1
+        self.total += elapsed_ms
+        self.max = max(self.max, elapsed_ms)
+        if rows is not None:
+            self.rows += rows
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, fraction):
+        """Yüzdeliği histogramdan kova üst sınırı olarak tahmin eder."""
+        target = self.count * fraction
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                return HISTOGRAM_BOUNDS_MS[i] if i < len(HISTOGRAM_BOUNDS_MS) else round(self.max, 3)
+        return round(self.max, 3)
+
+    def to_dict(self):
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max, 3),
+            "rows": self.rows,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class Instrumentation:
+    """Sarmalanan metotların süre istatistiklerini ve yavaş sorgularını toplar.
+
+    Birden çok iş parçacığından (ör. arka plan işçisi) güvenle kullanılabilir.
+    """
+
+    def __init__(self, slow_ms=50.0, max_slow_queries=100):
+        self.slow_ms = slow_ms
+        self.methods = {}
+        self.slow_queries = deque(maxlen=max_slow_queries)
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, obj, label=None, include=None):
+        """`obj` nesnesinin metotlarını örnek düzeyinde sarmalar ve nesneyi döndürür.
+
+        `include(ad)` verilmezse alt çizgiyle başlamayan tüm metotlar ölçülür.
+        Nesnenin bir `conn` bağlantısı varsa SQL izleme de açılır.
+        """
+        label = label or type(obj).__name__
+        include = include or (lambda name: not name.startswith("_"))
+        connection = getattr(obj, "conn", None)
+        for name, member in inspect.getmembers(type(obj), callable):
+            if not include(name) or isinstance(member, type) or inspect.isgeneratorfunction(member):
+                continue
+            setattr(obj, name, self._wrap(f"{label}.{name}", getattr(obj, name), connection))
+        if connection is not None:
+            connection.set_trace_callback(self._trace)
+        return obj
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _trace(self, statement):
+        # "--" ile başlayanlar tetikleyici/sanal tablo içi alt sorgulardır; FTS5 kendi
+        # iç sorgularını da "'main'." şema önekiyle çalıştırır
+        if statement.startswith("--") or "'main'." in statement:
+            return
+        stack = self._stack()
+        if stack and not getattr(self._local, "explaining", False) and len(stack[-1]) < MAX_STATEMENTS_PER_CALL:
+            stack[-1].append(statement)
+
+    def _wrap(self, name, method, connection):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            statements = []
+            stack.append(statements)
+            started = time.perf_counter()
+            try:
+                return_value = method(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                stack.pop()
+                if stack:
+                    # Dış çağrı da içteki sorguları görsün
+                    stack[-1].extend(statements[:MAX_STATEMENTS_PER_CALL - len(stack[-1])])
+            rows = len(return_value) if isinstance(return_value, list) else None
+            slow = None
+            if connection is not None and elapsed_ms >= self.slow_ms and statements:
+                slow = self._explain(name, elapsed_ms, rows, statements, connection)
+            with self._lock:
+                stats = self.methods.get(name)
+                if stats is None:
+                    stats = self.methods[name] = MethodStats()
+                stats.add(elapsed_ms, rows)
+                if slow:
+                    self.slow_queries.append(slow)
+            return return_value
+        return wrapper
+
+    def _explain(self, name, elapsed_ms, rows, statements, connection):
+        """Yavaş çağrıdaki sorguların planlarını aynı bağlantı üzerinden alır."""
+        queries = []
+        self._local.explaining = True
+        try:
+            for statement in dict.fromkeys(statements):
+                plan = None
+                if statement.lstrip().upper().startswith(PLANNABLE_PREFIXES):
+                    try:
+                        plan = [row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}")]
+                    except Exception as e:
+                        plan = [f"plan alınamadı: {e}"]
+                queries.append({"sql": " ".join(statement.split()), "plan": plan})
+        finally:
+            self._local.explaining = False
+        return {
+            "method": name,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "rows": rows,
+            "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "queries": queries,
+        }
+
+    def snapshot(self):
+        """Toplanan ölçümleri JSON'a uygun bir sözlük olarak döndürür."""
+        with self._lock:
+            methods = {name: stats.to_dict() for name, stats in self.methods.items()}
+            slow_queries = list(self.slow_queries)
+        return {
+            "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "slow_ms": self.slow_ms,
+            "methods": dict(sorted(methods.items(), key=lambda item: -item[1]["total_ms"])),
+            "slow_queries": slow_queries,
+        }
+
+    def dump(self, path):
+        """Ölçümleri JSON dosyasına yazar."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self.methods.clear()
+            self.slow_queries.clear()
+            self.started = time.time()
@@ -1,13 +1,151 @@
-import customtkinter as ctk
-from gui import FinanceApp
-from finance_manager import FinanceManager
-from database import Database
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from database import CONNECTION_PROFILES, Database
+
+CONFIG_FILE = "finance_config.json"
+DIAGNOSTICS_FILE = "finance_diagnostics.json"
+DEFAULT_CONFIG = {
+    "database": "finance.db",
+    "profile": "performance",
+    "pragmas": {},
+    "in_memory": False,
+}
+
+
+def load_config(path=CONFIG_FILE):
+    """Varsa yapılandırma dosyasını okuyup varsayılanlarla birleştirir."""
+    config = dict(DEFAULT_CONFIG)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config.update(json.load(f))
+    return config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kişisel Finans Takip")
+    parser.add_argument("--config", default=CONFIG_FILE, help="Yapılandırma dosyası (JSON)")
+    parser.add_argument("--db", help="Veritabanı dosyası")
+    parser.add_argument("--db-profile", choices=sorted(CONNECTION_PROFILES),
+                        help="SQLite bağlantı profili")
+    parser.add_argument("--in-memory", action="store_true", default=None,
+                        help="İşlem listesi sayımlarını ve özetleri bellek içi sütun kopyasından hesaplar")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Açılış sırasında içe aktarma/başlatma sürelerini yazdırır")
+    parser.add_argument("--rebuild-totals", action="store_true",
+                        help="Aylık ve günlük özet tablolarını işlemlerden yeniden oluşturur ve çıkar")
+    parser.add_argument("--verify-totals", action="store_true",
+                        help="Aylık özet tablosunu işlemlerle karşılaştırır ve çıkar")
+    parser.add_argument("--no-recurring", action="store_true",
+                        help="Açılışta vadesi gelmiş tekrarlayan işlemleri oluşturmaz")
+    parser.add_argument("--instrument", nargs="?", const=DIAGNOSTICS_FILE, metavar="JSON",
+                        help="Metot/SQL süre ölçümlerini açar; çıkışta sonuçları JSON dosyasına yazar")
+    parser.add_argument("--slow-ms", type=float, default=50.0,
+                        help="Sorgu planı kaydedilecek yavaş çağrı eşiği (ms, --instrument ile)")
+    return parser.parse_args()
+
+
+class StartupProfiler:
+    """Açılış adımlarının sürelerini ölçer."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - started))
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("Açılış süreleri:")
+        for name, seconds in self.steps:
+            print(f"  {name:<32}{seconds * 1000:>9.1f} ms")
+        print(f"  {'toplam':<32}{(time.perf_counter() - self.started) * 1000:>9.1f} ms")
+        print(f"  pandas yüklendi: {'evet' if 'pandas' in sys.modules else 'hayır'}")
+
+
+def run_maintenance(args, finance_manager):
+    """Bakım komutlarını çalıştırır; çıkış kodunu döndürür."""
+    if args.rebuild_totals:
+        finance_manager.rebuild_monthly_totals()
+        print("Aylık ve günlük özet tabloları yeniden oluşturuldu.")
+    if args.verify_totals:
+        mismatches = finance_manager.verify_monthly_totals()
+        for year, month, type_, category, total, count, actual_total, actual_count in mismatches:
+            print(f"{year}-{month:02d} {type_} {category}: özet {total:.2f} ({count}) "
+                  f"!= gerçek {actual_total:.2f} ({actual_count})")
+        print("Aylık özet tablosu tutarlı." if not mismatches else f"{len(mismatches)} tutarsızlık bulundu.")
+        return 1 if mismatches else 0
+    return 0
+
+
+def main():
+    args = parse_args()
+    profiler = StartupProfiler(args.profile_startup)
+    config = load_config(args.config)
+    db_path = args.db or config["database"]
+    profile = args.db_profile or config["profile"]
+    in_memory = args.in_memory or config["in_memory"]
+    instrumentation = None
+    if args.instrument:
+        from instrumentation import Instrumentation
+        instrumentation = Instrumentation(slow_ms=args.slow_ms)
+    with profiler.step("veritabanı bağlantısı"):
+        db = Database(db_path, profile=profile, pragmas=config["pragmas"])
+    with profiler.step("FinanceManager"):
+        from finance_manager import FinanceManager
+
+        def create_manager(database):
+            manager = FinanceManager(database, in_memory=in_memory)
+            # Ölçüm kapalıyken hiçbir metot sarmalanmaz
+            if instrumentation:
+                instrumentation.instrument(database)
+                instrumentation.instrument(manager)
+            return manager
+
+        finance_manager = create_manager(db)
+    if args.rebuild_totals or args.verify_totals:
+        profiler.report()
+        exit_code = run_maintenance(args, finance_manager)
+        if instrumentation:
+            instrumentation.dump(args.instrument)
+        return exit_code
+
+    if not args.no_recurring:
+        with profiler.step("tekrarlayan işlemler"):
+            finance_manager.materialize_recurring()
+
+    with profiler.step("import customtkinter"):
+        import customtkinter as ctk
+    with profiler.step("import gui"):
+        from gui import FinanceApp
+        from worker import BackgroundWorker
+    with profiler.step("ana pencere"):
+        ctk.set_appearance_mode("dark")  # "light" veya "dark" tema
+        ctk.set_default_color_theme("blue")  # Tema rengi
+        root = ctk.CTk()
+    with profiler.step("FinanceApp"):
+        # Sorgular arka planda kendi bağlantısıyla çalışır; yazmalar ana bağlantıdan yapılır
+        worker = BackgroundWorker(
+            root, lambda: create_manager(Database(db_path, profile=profile, pragmas=config["pragmas"]))
+        )
+        app = FinanceApp(root, finance_manager, worker, instrumentation, args.instrument)
+    root.after_idle(profiler.report)
+    root.mainloop()
+    if instrumentation:
+        instrumentation.dump(args.instrument)
+    return 0
+
 
 if __name__ == "__main__":
-    ctk.set_appearance_mode("dark")  # "light" veya "dark" tema
-    ctk.set_default_color_theme("blue")  # Tema rengi
-    root = ctk.CTk()
-    db = Database("finance.db")
-    finance_manager = FinanceManager(db)
-    app = FinanceApp(root, finance_manager)
-    root.mainloop()
\ No newline at end of file
+    raise SystemExit(main())
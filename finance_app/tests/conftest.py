@@ -0,0 +1,15 @@
+import pytest
+from database import Database
+from finance_manager import FinanceManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "finance.db"))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def fm(db):
+    return FinanceManager(db)
@@ -0,0 +1,47 @@
+import os
+import stat
+
+import pytest
+from atomic_file import atomic_output
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def umask_022():
+    # Modül umask'ı içe aktarılırken okur; test bilinen bir değerle çalışsın
+    import atomic_file
+    old, atomic_file._UMASK = atomic_file._UMASK, 0o022
+    yield
+    atomic_file._UMASK = old
+
+
+def test_new_file_follows_umask(tmp_path, umask_022):
+    path = tmp_path / "rapor.csv"
+    with atomic_output(str(path)) as f:
+        f.write("a")
+    assert mode(path) == 0o644
+    assert path.read_text() == "a"
+
+
+def test_existing_file_keeps_its_mode(tmp_path, umask_022):
+    path = tmp_path / "chart.html"
+    path.write_text("eski")
+    os.chmod(path, 0o640)
+    with atomic_output(str(path)) as f:
+        f.write("yeni")
+    assert mode(path) == 0o640
+    assert path.read_text() == "yeni"
+
+
+def test_failure_leaves_target_and_no_temp_file(tmp_path):
+    path = tmp_path / "rapor.csv"
+    path.write_text("eski")
+    with pytest.raises(RuntimeError):
+        with atomic_output(str(path), prefix=".export_") as f:
+            f.write("yarım")
+            raise RuntimeError
+    assert path.read_text() == "eski"
+    assert os.listdir(tmp_path) == ["rapor.csv"]
@@ -0,0 +1,43 @@
+import pytest
+
+
+def distinct_years(db):
+    db.cursor.execute("SELECT DISTINCT CAST(substr(date, 1, 4) AS INTEGER) FROM transactions ORDER BY 1")
+    return [row[0] for row in db.cursor.fetchall()]
+
+
+def year_months(db):
+    db.cursor.execute('''
+        SELECT CAST(substr(date, 1, 4) AS INTEGER), CAST(substr(date, 6, 2) AS INTEGER), COUNT(*)
+        FROM transactions GROUP BY 1, 2 ORDER BY 1, 2
+    ''')
+    return db.cursor.fetchall()
+
+
+@pytest.fixture
+def spread(fm):
+    fm.import_transactions([
+        ("Gider", 1, "Kira", "2019-12-31", ""),
+        ("Gider", 2, "Kira", "2021-06-15", ""),
+        ("Gelir", 3, "Maaş", "2021-06-01", ""),
+        ("Gider", 4, "Yiyecek", "2026-01-01", ""),
+    ])
+    return fm
+
+
+def test_rollup_years_match_distinct_scan(spread):
+    assert spread.db.get_available_years() == distinct_years(spread.db) == [2019, 2021, 2026]
+    assert spread.db.get_year_months() == year_months(spread.db)
+
+
+def test_years_follow_inserts_and_deletes(spread):
+    spread.add_transaction("Gider", 5, "Kira", "2023-03-03", "")
+    assert spread.get_available_years() == distinct_years(spread.db)
+    only_2019 = [row[0] for row in spread.get_transactions(year="2019")]
+    spread.delete_transactions(only_2019)
+    assert spread.get_available_years() == distinct_years(spread.db) == [2021, 2023, 2026]
+    assert spread.db.get_year_months() == year_months(spread.db)
+
+
+def test_empty_database(fm):
+    assert fm.db.get_available_years() == distinct_years(fm.db) == []
@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+import pytest
+
+ROWS = [
+    ("Gider", 100.10, "Kira", "2025-11-05", "kira"),
+    ("Gider", 0.20, "Yiyecek", "2025-11-20", "market"),
+    ("Gelir", 5000, "Maaş", "2025-11-01", "maaş"),
+    ("Gider", 300, "Kira", "2025-12-05", "kira"),
+    ("Gider", 45.55, "Yiyecek", "2026-01-09", "market"),
+    ("Gelir", 5000, "Maaş", "2026-02-01", "maaş"),
+]
+BUDGETS = [("2025", "11", 150.0), ("2026", "01", 40.0), ("2026", "03", 999.0)]
+
+
+@pytest.fixture
+def budgeted(fm):
+    fm.import_transactions(ROWS)
+    for year, month, amount in BUDGETS:
+        fm.set_budget(year, month, amount)
+    return fm
+
+
+def per_month_report(fm, year=None, month=None):
+    """Eski mantık: gider satırlarını aya göre topla, her ay için get_budget çağır."""
+    expenses = defaultdict(float)
+    for _, _, amount, _, date, _ in fm.get_transactions(type="Gider", year=year, month=month):
+        expenses[date[:7]] += amount
+    report = []
+    for period in sorted(expenses):
+        budget = fm.db.get_budget(period[:4], period[5:7]) or 0.0
+        report.append((period, budget, expenses[period], budget - expenses[period]))
+    return report
+
+
+@pytest.mark.parametrize("filters", [{}, {"year": "2025"}, {"year": "2026", "month": "01"}, {"month": "11"}, {"year": "2024"}])
+def test_single_query_matches_per_month_logic(budgeted, filters):
+    report = budgeted.get_budget_report(**filters)
+    expected = per_month_report(budgeted, **filters)
+    assert [row[0] for row in report] == [row[0] for row in expected]
+    for actual, old in zip(report, expected):
+        assert actual[1:] == pytest.approx(old[1:])
+
+
+def test_months_without_expense_or_budget(budgeted):
+    periods = {row[0]: row for row in budgeted.get_budget_report()}
+    # Yalnızca bütçesi olan ay (2026-03) ve yalnızca geliri olan ay (2026-02) raporda yok
+    assert sorted(periods) == ["2025-11", "2025-12", "2026-01"]
+    assert periods["2025-12"] == ("2025-12", 0.0, 300.0, -300.0)
+    assert periods["2025-11"] == ("2025-11", 150.0, 100.3, 49.7)
+
+
+def test_report_follows_budget_changes(budgeted):
+    budgeted.set_budget("2025", "12", 250)
+    assert budgeted.get_budget_report(year="2025", month="12") == [("2025-12", 250.0, 300.0, -50.0)]
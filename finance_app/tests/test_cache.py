@@ -0,0 +1,39 @@
+from database import Database
+from finance_manager import FinanceManager
+
+
+def test_reads_are_cached_until_a_write(fm):
+    fm.add_transaction("Gider", 10, "Kira", "2026-01-05", "kira")
+    first = fm.get_transactions()
+    assert fm.get_transactions() is first
+    assert fm.cache.info()["hits"] == 1
+    fm.add_transaction("Gider", 20, "Kira", "2026-01-06", "kira")
+    assert len(fm.get_transactions()) == 2
+
+
+def test_each_write_invalidates(fm):
+    fm.set_budget("2026", "01", 500)
+    assert fm.get_budget("2026", "01") == 500
+    fm.set_budget("2026", "01", 700)
+    assert fm.get_budget("2026", "01") == 700
+    fm.add_transaction("Gider", 10, "Kira", "2026-01-05", "kira")
+    assert fm.count_transactions() == 1
+    fm.delete_transactions([row[0] for row in fm.get_transactions()])
+    assert fm.count_transactions() == 0
+
+
+def test_writes_from_another_connection_invalidate(fm, tmp_path):
+    assert fm.count_transactions() == 0
+    other_db = Database(str(tmp_path / "finance.db"))
+    try:
+        FinanceManager(other_db).add_transaction("Gider", 10, "Kira", "2026-01-05", "kira")
+    finally:
+        other_db.close()
+    assert fm.count_transactions() == 1
+
+
+def test_cache_is_bounded(db):
+    fm = FinanceManager(db, cache_size=4)
+    for month in range(1, 13):
+        fm.get_budget("2026", f"{month:02d}")
+    assert fm.cache.info()["size"] == 4
@@ -0,0 +1,61 @@
+import pytest
+
+
+@pytest.fixture
+def january(fm):
+    fm.import_transactions([
+        ("Gider", 120.50, "Yiyecek", "2026-01-03", "market"),
+        ("Gider", 80, "Yiyecek", "2026-01-20", "market"),
+        ("Gider", 300, "Eğlence", "2026-01-12", "konser"),
+        ("Gelir", 5000, "Maaş", "2026-01-01", "maaş"),
+        ("Gider", 999, "Yiyecek", "2026-02-01", "şubat"),
+    ])
+    fm.set_category_budget(2026, 1, "Yiyecek", 250)
+    fm.set_category_budget(2026, 1, "Ulaşım", 100)
+    return fm
+
+
+def by_category(status):
+    return {item["category"]: item for item in status}
+
+
+def test_spend_against_limit(january):
+    food = by_category(january.budget_status(2026, 1))["Yiyecek"]
+    assert food == {"category": "Yiyecek", "limit": 250, "spent": 200.5, "remaining": 49.5, "used": 0.802}
+
+
+def test_spend_without_limit(january):
+    fun = by_category(january.budget_status(2026, 1))["Eğlence"]
+    assert fun == {"category": "Eğlence", "limit": None, "spent": 300, "remaining": None, "used": None}
+
+
+def test_limit_without_spend(january):
+    transport = by_category(january.budget_status(2026, 1))["Ulaşım"]
+    assert transport == {"category": "Ulaşım", "limit": 100, "spent": 0, "remaining": 100, "used": 0}
+
+
+def test_income_and_other_months_are_excluded(january):
+    status = january.budget_status(2026, 1)
+    assert [item["category"] for item in status] == ["Eğlence", "Ulaşım", "Yiyecek"]
+    assert january.budget_status(2026, 3) == []
+
+
+def test_set_category_budget_upserts(january):
+    january.set_category_budget("2026", "01", "Yiyecek", 180)
+    january.db.cursor.execute("SELECT COUNT(*) FROM category_budgets WHERE category = 'Yiyecek'")
+    assert january.db.cursor.fetchone()[0] == 1
+    food = by_category(january.budget_status(2026, 1))["Yiyecek"]
+    assert (food["limit"], food["remaining"]) == (180, -20.5)
+
+
+def test_status_follows_new_spending_and_deletes(january):
+    january.add_transaction("Gider", 60, "Ulaşım", "2026-01-15", "taksi")
+    assert by_category(january.budget_status(2026, 1))["Ulaşım"]["used"] == 0.6
+    january.delete_category_budget(2026, 1, "Ulaşım")
+    assert by_category(january.budget_status(2026, 1))["Ulaşım"]["limit"] is None
+
+
+@pytest.mark.parametrize("category, amount", [("", 100), ("Yiyecek", 0), ("Yiyecek", "abc")])
+def test_invalid_category_budgets_are_rejected(fm, category, amount):
+    with pytest.raises(ValueError):
+        fm.set_category_budget(2026, 1, category, amount)
@@ -0,0 +1,57 @@
+import os
+
+import chart_renderer
+import pytest
+from finance_manager import pie_chart_config
+
+CONFIG = pie_chart_config("Gider Dağılımı", [("Kira", 1000.0), ("Yiyecek", 250.5)])
+
+
+@pytest.fixture
+def page(tmp_path):
+    return str(tmp_path / "chart.html")
+
+
+def test_page_embeds_local_chart_js(page):
+    path, changed = chart_renderer.render_chart(CONFIG, "Gider", page)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert changed
+    assert "<script src=" not in text
+    assert "cdn" not in text.lower()
+    with open(chart_renderer.CHART_JS_PATH, encoding="utf-8") as f:
+        assert f.read() in text
+    assert f'"{chart_renderer.CHART_JS_VERSION}"' in text
+
+
+def test_unchanged_data_skips_render(page):
+    chart_renderer.render_chart(CONFIG, "Gider", page)
+    os.utime(page, (0, 0))
+    assert chart_renderer.render_chart(CONFIG, "Gider", page) == (page, False)
+    assert os.stat(page).st_mtime == 0
+
+
+@pytest.mark.parametrize("config, title", [
+    (pie_chart_config("Gider Dağılımı", [("Kira", 999.0)]), "Gider"),
+    (CONFIG, "Gelir"),
+])
+def test_changed_data_rerenders(page, config, title):
+    chart_renderer.render_chart(CONFIG, "Gider", page)
+    assert chart_renderer.render_chart(config, title, page) == (page, True)
+
+
+def test_changed_asset_rerenders(page, monkeypatch):
+    chart_renderer.render_chart(CONFIG, "Gider", page)
+    monkeypatch.setattr(chart_renderer, "_chart_js_digest", lambda: "yeni sürüm")
+    assert chart_renderer.render_chart(CONFIG, "Gider", page)[1]
+
+
+def test_user_text_is_not_executable(page):
+    hostile = "</script><script>alert(1)</script>"
+    chart_renderer.render_chart(pie_chart_config(hostile, [(hostile, 1.0)]), hostile, page)
+    with open(page, encoding="utf-8") as f:
+        text = f.read()
+    # Betik bloğunu kapatan "</" kaçırılır; metin JSON dizesi olarak kalır
+    assert hostile not in text
+    assert "<\\/script><script>alert(1)" in text
+    assert "new Function" not in text
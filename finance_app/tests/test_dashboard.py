@@ -0,0 +1,64 @@
+import json
+import os
+
+import chart_renderer
+import pytest
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def dashboard_fm(fm):
+    fm.import_transactions([
+        ("Gelir", 5000, "Maaş", "2026-01-01", "maaş"),
+        ("Gider", 1000, "Kira", "2026-01-05", "kira"),
+        ("Gider", 250.5, "Yiyecek", "2026-01-09", "market"),
+        ("Gider", 1000, "Kira", "2026-02-05", "kira"),
+        ("Gider", 40, "Kira", "2025-12-05", "geçen yıl"),
+    ])
+    fm.set_budget("2026", "02", 1500)
+    return fm
+
+
+def test_bundle_from_one_aggregate(dashboard_fm):
+    bundle = dashboard_fm.generate_dashboard(2026, 2)
+    assert bundle["periods"] == ["2026-01", "2026-02"]
+    charts = bundle["charts"]
+    assert set(charts) == {"expense_trend", "income_vs_expense", "budget_vs_actual",
+                           "income_categories", "expense_categories"}
+    assert charts["income_vs_expense"]["data"]["datasets"][0]["data"] == [5000.0, 0.0]
+    assert charts["budget_vs_actual"]["data"]["datasets"][0]["data"] == [0.0, 1500]
+    assert charts["expense_trend"]["data"]["datasets"][0]["data"] == [1250.5, 1000.0]
+    # Pastalar yalnızca seçilen ayı kapsar
+    assert charts["expense_categories"]["data"]["labels"] == ["Kira"]
+    assert charts["income_categories"]["data"]["labels"] == ["Veri Yok"]
+
+
+def test_render_writes_page_and_json_once(dashboard_fm, tmp_path):
+    page, data = str(tmp_path / "dashboard.html"), str(tmp_path / "dashboard.json")
+    bundle = dashboard_fm.generate_dashboard(2026)
+    assert chart_renderer.render_dashboard(bundle, page, data) == (page, True)
+    assert load(data)["charts"].keys() == bundle["charts"].keys()
+    with open(page, encoding="utf-8") as f:
+        text = f.read()
+    assert text.count("new Chart(") == 1 and "<script src=" not in text
+
+    os.utime(page, (0, 0))
+    os.utime(data, (0, 0))
+    assert chart_renderer.render_dashboard(dashboard_fm.generate_dashboard(2026), page, data) == (page, False)
+    assert os.stat(page).st_mtime == os.stat(data).st_mtime == 0
+
+    os.remove(data)
+    chart_renderer.render_dashboard(bundle, page, data)
+    assert os.path.exists(data) and os.stat(page).st_mtime == 0
+
+
+def test_new_transaction_rerenders(dashboard_fm, tmp_path):
+    page, data = str(tmp_path / "dashboard.html"), str(tmp_path / "dashboard.json")
+    chart_renderer.render_dashboard(dashboard_fm.generate_dashboard(2026), page, data)
+    dashboard_fm.add_transaction("Gider", 10, "Yiyecek", "2026-02-10", "market")
+    assert chart_renderer.render_dashboard(dashboard_fm.generate_dashboard(2026), page, data)[1]
+    assert load(data)["charts"]["expense_trend"]["data"]["datasets"][0]["data"] == [1250.5, 1010.0]
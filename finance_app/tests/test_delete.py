@@ -0,0 +1,39 @@
+import pytest
+from tests.test_rollups import assert_rollups_consistent
+
+
+@pytest.fixture
+def rows(fm):
+    fm.import_transactions([
+        ("Gider", i % 97 + 0.5, "Market" if i % 2 else "Kira", f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}", f"satır {i}")
+        for i in range(1200)
+    ])
+    return fm
+
+
+def test_delete_spanning_several_chunks(rows):
+    ids = [row[0] for row in rows.get_transactions()]
+    # Üç tam parça ve bir kısmi parça; olmayan id'ler sayılmaz
+    doomed = ids[::2][:550] + [10 ** 9]
+    assert rows.db.delete_transactions(doomed, chunk_size=150) == 550
+    assert rows.count_transactions() == 650
+    assert_rollups_consistent(rows)
+
+
+def test_manager_delete_over_default_chunk_size(rows):
+    ids = [row[0] for row in rows.get_transactions()]
+    assert rows.delete_transactions(ids[:1100]) == 1100
+    assert [row[0] for row in rows.get_transactions()] == ids[1100:]
+    assert_rollups_consistent(rows)
+
+
+def test_failed_chunk_rolls_back_everything(rows):
+    ids = [row[0] for row in rows.get_transactions()]
+    rows.db.cursor.execute(f'''
+        CREATE TRIGGER fail_late_delete BEFORE DELETE ON transactions WHEN OLD.id = {ids[-1]}
+        BEGIN SELECT RAISE(ABORT, 'silinemez'); END
+    ''')
+    with pytest.raises(Exception, match="silinemez"):
+        rows.db.delete_transactions(ids, chunk_size=100)
+    assert rows.db.count_transactions() == 1200
+    assert_rollups_consistent(rows)
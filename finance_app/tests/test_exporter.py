@@ -0,0 +1,52 @@
+import csv
+import os
+
+import pytest
+from exporter import export
+
+
+@pytest.fixture
+def fm_with_rows(fm):
+    fm.add_transaction("Gider", 100.0, "Kira", "2026-01-05", "kira")
+    fm.add_transaction("Gider", 40.5, "Market", "2026-01-12", "market")
+    fm.add_transaction("Gelir", 500.0, "Maaş", "2026-01-01", "maaş")
+    return fm
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_transaction_export_applies_filters(fm_with_rows, tmp_path):
+    path = str(tmp_path / "islemler.csv")
+    written = export(fm_with_rows, path, type="Gider", category="Kira")
+    rows = read_csv(path)
+    assert written == 1
+    assert rows[0] == ["id", "type", "amount", "category", "date", "description"]
+    assert rows[1][3] == "Kira"
+
+
+@pytest.mark.parametrize("report, filters", [
+    ("budget", {"category": "Kira"}),
+    ("budget", {"type": "Gider"}),
+    ("monthly", {"start_date": "2026-01-01"}),
+])
+def test_unsupported_report_filters_are_rejected(fm_with_rows, tmp_path, report, filters):
+    path = tmp_path / "rapor.csv"
+    with pytest.raises(ValueError, match="desteklemez"):
+        export(fm_with_rows, str(path), report=report, **filters)
+    assert not path.exists()
+
+
+def test_failed_export_keeps_previous_file(fm_with_rows, tmp_path):
+    path = tmp_path / "islemler.csv"
+    path.write_text("eski", encoding="utf-8")
+
+    def fail(written, total):
+        raise RuntimeError("iptal")
+
+    with pytest.raises(RuntimeError):
+        export(fm_with_rows, str(path), chunk_size=1, progress=fail)
+    assert path.read_text(encoding="utf-8") == "eski"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+
+ROWS = [
+    ("Gider", 10.10, "Kira", "2024-02-29", "artık gün"),
+    ("Gider", 20.20, "Yiyecek", "2024-12-31 23:59:00", "yıl sonu, saatli"),
+    ("Gelir", 30.30, "Maaş", "2025-01-01", "yıl başı"),
+    ("Gider", 40.40, "Yiyecek", "2025-01-31", "ay sonu"),
+    ("Gider", 50.50, "Kira", "2025-02-01", "ay başı"),
+    ("Gider", 60.60, "Yiyecek", "2025-12-15 08:00:00", "saatli"),
+    ("Gelir", 0.07, "Diğer", "2026-01-01", "küçük tutar"),
+]
+
+
+@pytest.fixture
+def filtered(fm):
+    # Saat içeren eski kayıtlar import_transactions'ta kırpılır; olduğu gibi saklansın diye doğrudan eklenir
+    fm.db.add_transactions(ROWS)
+    return fm
+
+
+def raw(category=None, type=None, year=None, month=None, start_date=None, end_date=None):
+    """Filtrelerin beklenen anlamı, satır satır Python ile."""
+    result = []
+    for type_, amount, category_, text, description in ROWS:
+        day = date.fromisoformat(text[:10])
+        if (category and category_ != category) or (type and type_ != type):
+            continue
+        if (year and day.year != int(year)) or (month and day.month != int(month)):
+            continue
+        if (start_date and day < date.fromisoformat(start_date)) or (end_date and day > date.fromisoformat(end_date)):
+            continue
+        result.append((type_, amount, category_, text, description))
+    return sorted(result, key=lambda row: row[3][:10])
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"year": "2024"},
+    {"year": "2024", "month": "02"},
+    {"year": "2025", "month": "1"},
+    {"month": "12"},
+    {"month": "02", "type": "Gider"},
+    {"category": "Yiyecek", "year": "2025"},
+    {"start_date": "2024-12-31", "end_date": "2025-01-31"},
+    {"start_date": "2025-02-01"},
+    {"end_date": "2024-12-31"},
+    {"year": "2025", "start_date": "2025-01-15", "end_date": "2025-12-15"},
+    {"year": "2023"},
+])
+def test_range_filters_match_raw_rows(filtered, filters):
+    rows = filtered.get_transactions(**filters)
+    assert [row[1:] for row in rows] == raw(**filters)
+    assert filtered.count_transactions(**filters) == len(rows)
+
+
+def test_amounts_round_trip_through_minor_units(filtered):
+    filtered.db.cursor.execute("SELECT amount, amount_minor FROM transactions ORDER BY id")
+    for amount, amount_minor in filtered.db.cursor.fetchall():
+        assert amount_minor == round(amount * 100)
+    assert filtered.get_period_total(year="2025", type="Gider") == pytest.approx(40.40 + 50.50 + 60.60)
+
+
+def test_filters_use_date_ord_range(filtered):
+    conditions, params = filtered.db.transaction_filters(year="2025", month="02")
+    assert conditions == ["date_ord >= ? AND date_ord < ?"]
+    assert params == [date(2025, 2, 1).toordinal(), date(2025, 3, 1).toordinal()]
+    filtered.db.cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM transactions WHERE " + " AND ".join(conditions), params
+    )
+    assert "idx_transactions_date_ord" in " ".join(row[-1] for row in filtered.db.cursor.fetchall())
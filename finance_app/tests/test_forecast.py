@@ -0,0 +1,44 @@
+import pytest
+
+
+@pytest.fixture
+def rent_history(fm):
+    """2025 boyunca her ayın 5'inde 1000 TL kira."""
+    fm.import_transactions([("Gider", 1000, "Kira", f"2025-{month:02d}-05", "kira") for month in range(1, 13)])
+    return fm
+
+
+def category(forecast, name):
+    return next(item for item in forecast["categories"] if item["category"] == name)
+
+
+def test_paid_rent_is_not_expected_again(rent_history):
+    rent_history.add_transaction("Gider", 1000, "Kira", "2026-01-05", "kira")
+    forecast = rent_history.forecast_month(2026, 1, today="2026-01-10")
+    assert category(forecast, "Kira")["projected"] == pytest.approx(1000)
+
+
+def test_overdue_rent_is_still_expected(rent_history):
+    forecast = rent_history.forecast_month(2026, 1, today="2026-01-10")
+    assert forecast["spent"] == 0
+    assert category(forecast, "Kira")["projected"] == pytest.approx(1000)
+
+
+def test_closed_month_projects_what_was_spent(rent_history):
+    rent_history.add_transaction("Gider", 400, "Kira", "2026-01-05", "kira")
+    forecast = rent_history.forecast_month(2026, 1, today="2026-02-10")
+    assert category(forecast, "Kira")["projected"] == pytest.approx(400)
+
+
+def test_underspending_category_projects_below_its_average(fm):
+    fm.import_transactions([
+        ("Gider", 10, "Yiyecek", f"2025-{month:02d}-{day:02d}", "market")
+        for month in range(1, 13) for day in range(1, 29)
+    ])
+    fm.add_transaction("Gider", 30, "Yiyecek", "2026-01-10", "market")
+    forecast = fm.forecast_month(2026, 1, today="2026-01-14")
+    food = category(forecast, "Yiyecek")
+    # Ayın kalanında her zamanki hız beklenir; ilk 14 günün eksiği geri eklenmez
+    assert food["projected"] == pytest.approx(30 + 10 * 14)
+    assert food["projected"] < food["expected"]
+    assert forecast["projected_over"] is False
@@ -0,0 +1,49 @@
+import pytest
+from importer import parse_amount, read_csv
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1.234,56", 1234.56),
+    ("1.234.567,89", 1234567.89),
+    ("12,5", 12.5),
+    ("0,125", 0.125),
+    ("1 234,56 TL", 1234.56),
+    ("-45,00", -45.0),
+])
+def test_parse_amount_turkish_format(text, expected):
+    assert parse_amount(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1,234.56", 1234.56),
+    ("1,234,567.89", 1234567.89),
+    ("-1234.56", -1234.56),
+    ("12345.678", 12345.678),
+    ("1,234,567", 1234567.0),
+    ("100", 100.0),
+])
+def test_parse_amount_english_format(text, expected):
+    assert parse_amount(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["1,234", "1.234", "-1,234"])
+def test_parse_amount_rejects_ambiguous_separator(text):
+    with pytest.raises(ValueError, match="Belirsiz"):
+        parse_amount(text)
+
+
+@pytest.mark.parametrize("text", ["", "abc", "1.2.3", "1,23,4.5", "1,234.5.6", ",5"])
+def test_parse_amount_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        parse_amount(text)
+
+
+def test_import_rejects_ambiguous_rows(tmp_path, fm):
+    path = tmp_path / "ekstre.csv"
+    path.write_text(
+        "tarih;tutar;açıklama\n2024-01-05;-1.234,50;market\n2024-01-06;1,234;belirsiz\n", encoding="utf-8"
+    )
+    inserted, rejected = fm.import_transactions(read_csv(str(path)))
+    assert inserted == 1
+    assert [line_no for line_no, _, _ in rejected] == [2]
+    assert fm.get_transactions()[0][1:3] == ("Gider", 1234.5)
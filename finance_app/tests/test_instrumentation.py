@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from instrumentation import Instrumentation, MethodStats
+
+
+@pytest.fixture
+def traced(db, fm):
+    fm.add_transaction("Gider", 10, "Kira", "2026-01-05", "kira")
+    instrumentation = Instrumentation(slow_ms=0)
+    instrumentation.instrument(db)
+    instrumentation.instrument(fm)
+    return instrumentation
+
+
+def queries(instrumentation, method):
+    return [query for slow in instrumentation.slow_queries if slow["method"] == method for query in slow["queries"]]
+
+
+def test_call_records_sql_and_plan(traced, db):
+    rows = db.get_transactions(year="2026", month="01")
+    stats = traced.snapshot()["methods"]["Database.get_transactions"]
+    assert (stats["count"], stats["rows"]) == (1, len(rows))
+    [query] = queries(traced, "Database.get_transactions")
+    # İz geri çağrısı parametreleri yerleştirilmiş SQL metnini verir
+    assert query["sql"].startswith("SELECT") and "WHERE date_ord >= " in query["sql"]
+    assert any("idx_transactions_date_ord" in step for step in query["plan"])
+
+
+def test_manager_calls_are_timed_and_database_calls_explained(traced, fm):
+    fm.count_transactions(type="Gider")
+    methods = traced.snapshot()["methods"]
+    assert methods["FinanceManager.count_transactions"]["count"] == 1
+    # Planlar yalnızca bağlantısı olan Database çağrıları için alınır
+    assert not queries(traced, "FinanceManager.count_transactions")
+    [query] = queries(traced, "Database.count_transactions")
+    assert query["sql"].startswith("SELECT COUNT(*) FROM transactions")
+    assert query["plan"]
+
+
+def test_trigger_and_plan_statements_are_not_recorded(traced, db):
+    db.add_transaction("Gider", 5, "Kira", "2026-01-06", "kira")
+    statements = [query["sql"] for query in queries(traced, "Database.add_transaction")]
+    assert statements and all(not sql.startswith(("--", "EXPLAIN")) for sql in statements)
+    assert not any("'main'." in sql for sql in statements)
+
+
+def test_fast_calls_are_not_explained(db):
+    instrumentation = Instrumentation(slow_ms=60_000)
+    instrumentation.instrument(db)
+    db.get_categories()
+    assert instrumentation.snapshot()["methods"]["Database.get_categories"]["count"] == 1
+    assert not instrumentation.slow_queries
+
+
+def test_dump_writes_json(traced, db, tmp_path):
+    db.get_categories()
+    path = tmp_path / "tanı.json"
+    traced.dump(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert "Database.get_categories" in data["methods"]
+    assert data["slow_queries"]
+
+
+def test_histogram_percentiles():
+    stats = MethodStats()
+    for elapsed in (0.05, 0.05, 0.3, 7, 2000):
+        stats.add(elapsed, None)
+    data = stats.to_dict()
+    assert data["count"] == 5 and data["max_ms"] == 2000
+    assert data["p50_ms"] == 0.5
+    assert data["p95_ms"] == 2000
+    assert sum(data["histogram"].values()) == 5
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+from database import Database
+
+LEGACY_SCHEMA = '''
+    CREATE TABLE transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type TEXT NOT NULL,
+        amount REAL NOT NULL,
+        category TEXT NOT NULL,
+        date TEXT NOT NULL,
+        description TEXT
+    )
+'''
+
+
+def legacy_db(path, rows, extra_columns=""):
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA.replace("description TEXT", "description TEXT" + extra_columns))
+    conn.executemany("INSERT INTO transactions (type, amount, category, date, description) VALUES (?, ?, ?, ?, ?)", rows)
+    # Silinmiş son satır: yeni id'ler eskileriyle çakışmamalı
+    conn.execute("INSERT INTO transactions (type, amount, category, date) VALUES ('Gider', 1, 'Diğer', '2024-01-01')")
+    conn.execute("DELETE FROM transactions WHERE id = (SELECT MAX(id) FROM transactions)")
+    conn.commit()
+    conn.close()
+
+
+def not_null(db, table="transactions"):
+    db.cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1]: bool(row[3]) for row in db.cursor.fetchall()}
+
+
+@pytest.mark.parametrize("extra_columns", ["", ", date_ord INTEGER, amount_minor INTEGER"])
+def test_legacy_rows_are_migrated(tmp_path, extra_columns):
+    path = str(tmp_path / "eski.db")
+    legacy_db(path, [
+        ("Gider", 12.34, "Kira", "2024-01-05", "kira"),
+        ("Gider", 10.1, "Market", "05.02.2024", "market"),
+        ("Gelir", 100, "Maaş", "2024/03/01", "maaş"),
+        ("Gider", 7, "Market", "2024-03-02 14:30:00", "akşam"),
+    ], extra_columns)
+    db = Database(path)
+    try:
+        columns = not_null(db)
+        assert columns["date_ord"] and columns["amount_minor"]
+        assert [row[4] for row in db.get_transactions()] == ["2024-01-05", "2024-02-05", "2024-03-01", "2024-03-02 14:30:00"]
+        assert db.count_transactions(month="2") == 1
+        assert db.verify_monthly_totals() == []
+        db.add_transaction("Gider", 1, "Diğer", "2024-04-01", "")
+        assert db.get_transactions(category="Diğer")[0][0] == 6
+        assert [row[0] for row in db.search_transactions("mark")] == [2]
+    finally:
+        db.close()
+    # İkinci açılışta geçiş tekrar çalışmaz
+    db = Database(path)
+    try:
+        assert db.count_transactions() == 5
+    finally:
+        db.close()
+
+
+def test_unreadable_dates_abort_migration(tmp_path):
+    path = str(tmp_path / "eski.db")
+    legacy_db(path, [("Gider", 1, "Kira", "2024-01-05", ""), ("Gider", 2, "Kira", "geçen salı", "")])
+    with pytest.raises(ValueError, match="geçen salı"):
+        Database(path)
+    conn = sqlite3.connect(path)
+    try:
+        assert [row[1] for row in conn.execute("PRAGMA table_info(transactions)")] == [
+            "id", "type", "amount", "category", "date", "description"
+        ]
+        assert conn.execute("SELECT date FROM transactions ORDER BY id").fetchall() == [("2024-01-05",), ("geçen salı",)]
+    finally:
+        conn.close()
@@ -0,0 +1,48 @@
+import pytest
+
+
+@pytest.fixture
+def many(fm):
+    # Aynı güne düşen çok sayıda satır imlecin id ile sürdürülmesini sınar
+    fm.import_transactions([
+        ("Gider" if i % 3 else "Gelir", i + 1, "Market" if i % 2 else "Kira", f"2026-{i % 4 + 1:02d}-{i % 3 + 1:02d}", "")
+        for i in range(257)
+    ])
+    return fm
+
+
+def all_pages(fm, limit, **kwargs):
+    rows, cursor, total = fm.get_transactions_page(limit=limit, with_total=True, **kwargs)
+    pages = [rows]
+    while cursor is not None:
+        rows, cursor, _ = fm.get_transactions_page(limit=limit, after=cursor, **kwargs)
+        pages.append(rows)
+    return [row for page in pages for row in page], total
+
+
+@pytest.mark.parametrize("limit", [1, 10, 64, 257, 500])
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_every_row_once(many, limit, descending):
+    rows, total = all_pages(many, limit, descending=descending)
+    expected = many.get_transactions()
+    assert total == len(expected) == 257
+    assert rows == (expected[::-1] if descending else expected)
+
+
+@pytest.mark.parametrize("filters", [{"type": "Gider"}, {"category": "Kira", "month": "02"}, {"year": "2026", "month": "03"}])
+def test_filtered_pages_match_full_query(many, filters):
+    rows, total = all_pages(many, 7, **filters)
+    expected = many.get_transactions(**filters)
+    assert total == len(expected)
+    assert rows == expected
+
+
+def test_delete_between_pages_skips_nothing(many):
+    first, cursor, _ = many.get_transactions_page(limit=50)
+    remaining = [row for row in many.get_transactions() if row not in first]
+    many.delete_transaction(remaining[0][0])
+    rows = []
+    while cursor is not None:
+        page, cursor, _ = many.get_transactions_page(limit=50, after=cursor)
+        rows.extend(page)
+    assert rows == remaining[1:]
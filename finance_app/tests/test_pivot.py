@@ -0,0 +1,87 @@
+from collections import defaultdict
+
+import pytest
+
+ROWS = [
+    ("Gider", 100.25, "Kira", "2025-12-05", "kira"),
+    ("Gider", 100.25, "Kira", "2026-01-05", "kira"),
+    ("Gider", 40, "Yiyecek", "2026-01-07", "market"),
+    ("Gider", 12.5, "Yiyecek", "2026-01-21", "fırın"),
+    ("Gelir", 5000, "Maaş", "2026-01-01", "maaş"),
+    ("Gider", 75, "Yiyecek", "2026-02-02", "market"),
+]
+
+
+@pytest.fixture
+def pivot_fm(fm):
+    fm.import_transactions(ROWS)
+    return fm
+
+
+def traced(db, call):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        return call(), " ".join(statements)
+    finally:
+        db.conn.set_trace_callback(None)
+
+
+def expected(key, rows=ROWS):
+    groups = defaultdict(list)
+    for type_, amount, category, date, _ in rows:
+        groups[key(type_, category, date)].append(amount)
+    return groups
+
+
+def test_rollup_and_raw_paths_agree(pivot_fm):
+    dims = ("period", "type", "category")
+    rollup, rollup_sql = traced(pivot_fm.db, lambda: pivot_fm.db.aggregate(dims, ("sum", "count")))
+    raw, raw_sql = traced(pivot_fm.db, lambda: pivot_fm.db.aggregate(dims, ("sum", "count", "min", "max")))
+    assert "FROM monthly_totals" in rollup_sql and "FROM transactions" in raw_sql
+    assert rollup == [record[:5] for record in raw]
+    groups = expected(lambda type_, category, date: (date[:7], type_, category))
+    assert [record[:3] for record in raw] == sorted(groups)
+    for period, type_, category, total, count, minimum, maximum in raw:
+        amounts = groups[(period, type_, category)]
+        assert (total, count, minimum, maximum) == (pytest.approx(sum(amounts)), len(amounts), min(amounts), max(amounts))
+
+
+def test_date_range_reads_raw_rows(pivot_fm):
+    records, sql = traced(
+        pivot_fm.db,
+        lambda: pivot_fm.db.aggregate(("category",), ("sum", "count"), type="Gider",
+                                      start_date="2026-01-06", end_date="2026-02-01")
+    )
+    assert "FROM transactions" in sql
+    assert records == [("Yiyecek", 52.5, 2)]
+
+
+def test_filters_apply_on_both_paths(pivot_fm):
+    for measures in (("sum",), ("sum", "min")):
+        records = pivot_fm.db.aggregate(("month",), measures, year="2026", category="Yiyecek")
+        assert [record[:2] for record in records] == [(1, 52.5), (2, 75.0)]
+
+
+def test_pivot_shape(pivot_fm):
+    result = pivot_fm.pivot(("period",), ("type",), measures=("sum", "count"))
+    assert result["rows"] == [("2025-12",), ("2026-01",), ("2026-02",)]
+    assert result["cols"] == [("Gelir",), ("Gider",)]
+    assert result["measures"] == ["sum", "count"]
+    for measure in result["measures"]:
+        assert len(result["values"][measure]) == len(result["rows"])
+        assert all(len(row) == len(result["cols"]) for row in result["values"][measure])
+    assert result["values"]["sum"] == [[None, 100.25], [5000.0, 152.75], [None, 75.0]]
+    assert result["values"]["count"] == [[None, 1], [1, 3], [None, 1]]
+
+
+def test_pivot_rows_only_and_errors(pivot_fm):
+    result = pivot_fm.pivot(("year", "month"), measures=("mean",), type="Gider")
+    assert result["cols"] == [()]
+    assert result["values"]["mean"] == [[100.25], [pytest.approx(152.75 / 3)], [75.0]]
+    with pytest.raises(ValueError):
+        pivot_fm.pivot(())
+    with pytest.raises(ValueError):
+        pivot_fm.pivot(("week",))
+    with pytest.raises(ValueError):
+        pivot_fm.pivot(("period",), measures=("median",))
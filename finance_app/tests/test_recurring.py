@@ -0,0 +1,54 @@
+import pytest
+from database import Database
+from finance_manager import FinanceManager
+
+
+def dates(fm, **filters):
+    return [row[4] for row in fm.get_transactions(**filters)]
+
+
+def test_materialize_is_idempotent(fm):
+    fm.add_recurring_rule("Gider", 1000, "Kira", "2026-01-05", description="kira")
+    assert fm.materialize_recurring(until="2026-03-10") == 3
+    assert fm.materialize_recurring(until="2026-03-10") == 0
+    assert fm.materialize_recurring(until="2026-03-31") == 0
+    assert dates(fm) == ["2026-01-05", "2026-02-05", "2026-03-05"]
+
+
+def test_catch_up_adds_only_missing_occurrences(fm):
+    fm.add_recurring_rule("Gider", 1000, "Kira", "2026-01-05", description="kira")
+    fm.materialize_recurring(until="2026-02-05")
+    assert fm.materialize_recurring(until="2026-06-30") == 4
+    assert len(set(dates(fm))) == len(dates(fm)) == 6
+    assert fm.verify_monthly_totals() == []
+
+
+def test_month_end_rule_clamps_to_short_months(fm):
+    fm.add_recurring_rule("Gider", 50, "Faturalar", "2026-01-31", description="fatura")
+    fm.materialize_recurring(until="2026-04-30")
+    assert dates(fm) == ["2026-01-31", "2026-02-28", "2026-03-31", "2026-04-30"]
+
+
+def test_end_date_and_interval(fm):
+    fm.add_recurring_rule("Gider", 10, "Eğitim", "2026-01-01", frequency="weekly", interval=2,
+                          end_date="2026-02-01", description="kurs")
+    fm.materialize_recurring(until="2026-12-31")
+    assert dates(fm) == ["2026-01-01", "2026-01-15", "2026-01-29"]
+
+
+def test_second_connection_does_not_duplicate(fm, tmp_path):
+    fm.add_recurring_rule("Gider", 1000, "Kira", "2026-01-05", description="kira")
+    other_db = Database(str(tmp_path / "finance.db"))
+    try:
+        other = FinanceManager(other_db)
+        assert fm.materialize_recurring(until="2026-02-28") == 2
+        assert other.materialize_recurring(until="2026-02-28") == 0
+    finally:
+        other_db.close()
+    assert fm.count_transactions() == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"frequency": "daily"}, {"interval": 0}, {"end_date": "2025-12-31"}])
+def test_invalid_rules_are_rejected(fm, kwargs):
+    with pytest.raises(ValueError):
+        fm.add_recurring_rule("Gider", 10, "Kira", "2026-01-01", **kwargs)
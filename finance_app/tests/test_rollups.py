@@ -0,0 +1,87 @@
+from datetime import date
+
+import pytest
+
+
+def daily_mismatches(db):
+    """daily_totals ile ham işlemlerden hesaplanan günlük toplamların farkı."""
+    db.cursor.execute('''
+        SELECT date_ord, type, category, SUM(amount_minor), COUNT(*) FROM transactions
+        GROUP BY date_ord, type, category
+    ''')
+    actual = set(db.cursor.fetchall())
+    db.cursor.execute("SELECT date_ord, type, category, total_minor, count FROM daily_totals")
+    return actual ^ set(db.cursor.fetchall())
+
+
+def assert_rollups_consistent(fm):
+    assert fm.verify_monthly_totals() == []
+    assert daily_mismatches(fm.db) == set()
+
+
+@pytest.fixture
+def filled(fm):
+    fm.add_transaction("Gider", 100.10, "Kira", "2026-01-05", "kira")
+    fm.add_transaction("Gider", 20.20, "Market", "2026-01-05", "market")
+    fm.add_transaction("Gelir", 1500, "Maaş", "2026-02-01", "maaş")
+    return fm
+
+
+def test_add(filled):
+    assert_rollups_consistent(filled)
+    assert filled.get_period_total(year="2026", month="01", type="Gider") == pytest.approx(120.30)
+
+
+def test_delete_removes_empty_groups(filled):
+    rent = filled.get_transactions(category="Kira")[0][0]
+    filled.delete_transaction(rent)
+    assert_rollups_consistent(filled)
+    filled.delete_transactions([row[0] for row in filled.get_transactions()])
+    assert_rollups_consistent(filled)
+    filled.db.cursor.execute("SELECT COUNT(*) FROM monthly_totals")
+    assert filled.db.cursor.fetchone()[0] == 0
+
+
+def test_update_moves_amount_between_groups(filled):
+    rent = filled.get_transactions(category="Kira")[0][0]
+    filled.db.cursor.execute('''
+        UPDATE transactions
+        SET amount = 90, amount_minor = 9000, category = 'Faturalar', date = '2026-02-10', date_ord = ?
+        WHERE id = ?
+    ''', (date(2026, 2, 10).toordinal(), rent))
+    filled.db.commit()
+    assert_rollups_consistent(filled)
+
+
+def test_import_uses_bulk_path(filled):
+    rows = [("Gider", f"{i}.25", "Market", f"2026-03-{i % 28 + 1:02d}", "market") for i in range(1, 300)]
+    inserted, rejected = filled.import_transactions(rows + [("Gider", "abc", "Market", "2026-03-01", "")])
+    assert (inserted, len(rejected)) == (299, 1)
+    assert_rollups_consistent(filled)
+    filled.db.cursor.execute("SELECT COUNT(*) FROM bulk_load")
+    assert filled.db.cursor.fetchone()[0] == 0
+    # Toplu yüklemeden sonra tetikleyiciler yeniden çalışır
+    filled.add_transaction("Gider", 1, "Market", "2026-03-01", "market")
+    assert_rollups_consistent(filled)
+
+
+def test_failed_import_leaves_rollups_untouched(filled):
+    def broken_rows():
+        yield ("Gider", 10, "Market", "2026-04-01", "market")
+        raise RuntimeError("okuma hatası")
+
+    with pytest.raises(RuntimeError):
+        filled.import_transactions(broken_rows(), chunk_size=1)
+    assert filled.count_transactions() == 3
+    assert_rollups_consistent(filled)
+
+
+def test_failed_bulk_insert_is_rolled_back(fm):
+    fm.add_transaction("Gider", 10, "Kira", "2026-01-05", "kira")
+    # NOT NULL ihlali ikinci satırda: ilk satır işlemde bekliyor olur
+    with pytest.raises(Exception):
+        fm.db.add_transactions([("Gider", 5, "Kira", "2026-01-06", ""), ("Gider", 5, None, "2026-01-07", "")])
+    assert not fm.db.conn.in_transaction
+    fm.db.commit()
+    assert fm.db.count_transactions() == 1
+    assert_rollups_consistent(fm)
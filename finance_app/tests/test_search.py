@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def described(fm):
+    fm.import_transactions([
+        ("Gider", 1500, "Kira", "2026-01-05", "Ocak kirası"),
+        ("Gider", 80, "Yiyecek", "2026-01-06", "Market alışverişi"),
+        ("Gelir", 30000, "Maaş", "2026-01-01", "Maaş ödemesi"),
+        ("Gider", 45, "Yiyecek", "2026-02-06", "market 100%_indirim"),
+    ])
+    return fm
+
+
+def descriptions(rows):
+    return sorted(row[5] for row in rows)
+
+
+def test_prefix_terms_must_all_match(described):
+    assert descriptions(described.search("mar")) == ["Market alışverişi", "market 100%_indirim"]
+    assert descriptions(described.search("mar alış")) == ["Market alışverişi"]
+    assert described.search("kira yok") == []
+
+
+def test_diacritics_are_ignored(described):
+    assert descriptions(described.search("maas odeme")) == ["Maaş ödemesi"]
+    assert descriptions(described.search("ODEME")) == ["Maaş ödemesi"]
+
+
+def test_filters_and_limit(described):
+    assert descriptions(described.search("market", month="02")) == ["market 100%_indirim"]
+    assert len(described.search("market", limit=1)) == 1
+
+
+def test_index_follows_deletes_and_single_inserts(described):
+    rent = described.search("kira")[0][0]
+    described.delete_transaction(rent)
+    assert described.search("kira") == []
+    described.add_transaction("Gider", 1500, "Kira", "2026-02-05", "Şubat kirası")
+    assert descriptions(described.search("kira")) == ["Şubat kirası"]
+
+
+def test_special_characters_are_literal(described):
+    assert described.search("%") == []
+    assert descriptions(described.search("100")) == ["market 100%_indirim"]
+
+
+def test_like_fallback(described):
+    described.db.has_search_index = False
+    assert descriptions(described.search("market")) == ["Market alışverişi", "market 100%_indirim"]
+    # LIKE joker karakterleri kaçırılır: "0_" "0%_" ile eşleşmemeli
+    assert described.search("0_") == []
@@ -0,0 +1,81 @@
+import pytest
+from finance_manager import FinanceManager
+
+FILTERS = [
+    {},
+    {"type": "Gider"},
+    {"category": "Kira"},
+    {"category": "Yok"},
+    {"year": "2026", "month": "02"},
+    {"month": "3"},
+    {"start_date": "2026-02-01", "end_date": "2026-04-30"},
+]
+
+
+@pytest.fixture
+def managers(db):
+    sql, memory = FinanceManager(db), FinanceManager(db, in_memory=True)
+    for month in range(1, 6):
+        memory.add_transaction("Gider", 100.25, "Kira", f"2026-{month:02d}-05", "kira")
+    memory.import_transactions([
+        ("Gelir", 1000, "Maaş", "2026-02-01", "maaş"),
+        ("Gider", 42.5, "Market", "2026-03-15", "market"),
+    ])
+    return sql, memory
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_store_matches_sql(managers, filters):
+    sql, memory = managers
+    assert memory.get_transactions(**filters) == sql.get_transactions(**filters)
+    assert memory.count_transactions(**filters) == sql.count_transactions(**filters)
+
+
+def test_store_follows_adds_and_deletes(managers):
+    sql, memory = managers
+    store = memory.transaction_store()
+    memory.add_transaction("Gider", 7, "Kira", "2026-06-05", "kira")
+    memory.delete_transaction(sql.get_transactions(category="Market")[0][0])
+    assert memory.transaction_store() is store
+    assert memory.get_transactions() == sql.get_transactions()
+
+
+def test_descriptions_are_shared_across_syncs(managers):
+    _, memory = managers
+    store = memory.transaction_store()
+    memory.add_transaction("Gider", 7, "Kira", "2026-06-05", "kira")
+    memory.add_transaction("Gider", 8, "Kira", "2026-07-05", "kira")
+    assert store.descriptions.count("kira") == 1
+    assert len(store.descriptions) == 3
+
+
+def test_date_range_summary_matches_sql(managers):
+    sql, memory = managers
+    filters = {"start_date": "2026-02-01", "end_date": "2026-04-30"}
+    expected = sql.generate_summary(**filters)
+    actual = memory.generate_summary(**filters)
+    assert list(actual.columns) == list(expected.columns)
+    assert [str(period) for period in actual.index] == [str(period) for period in expected.index]
+    assert actual.values.tolist() == expected.values.tolist()
+
+
+def test_writes_from_another_connection_are_applied_incrementally(db, tmp_path, monkeypatch):
+    from database import Database
+    reader = Database(str(tmp_path / "finance.db"))
+    try:
+        writer = FinanceManager(db)
+        memory = FinanceManager(reader, in_memory=True)
+        writer.import_transactions([("Gider", i + 1, "Market", f"2026-01-{i % 28 + 1:02d}", "market") for i in range(50)])
+        store = memory.transaction_store()
+        monkeypatch.setattr("finance_manager.TransactionStore.load", lambda db: pytest.fail("yeniden yüklendi"))
+
+        writer.add_transaction("Gider", 7, "Kira", "2026-02-05", "kira")
+        assert memory.count_transactions() == 51
+        ids = [row[0] for row in writer.get_transactions()]
+        writer.delete_transactions(ids[:10])
+        writer.add_transaction("Gelir", 9, "Maaş", "2026-02-06", "maaş")
+        assert memory.transaction_store() is store
+        assert memory.get_transactions() == writer.get_transactions()
+        assert store.descriptions.count("market") == 1
+    finally:
+        reader.close()
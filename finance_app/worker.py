@@ -0,0 +1,93 @@
+import logging
+import queue
+import threading
+
+
+class BackgroundWorker:
+    """Veritabanı işlerini Tk ana döngüsü dışında, kendi bağlantısıyla çalıştırır.
+
+    `factory` arka plan iş parçacığında çağrılır ve o iş parçacığına ait bir
+    FinanceManager döndürür (SQLite bağlantıları iş parçacıkları arasında
+    paylaşılmaz). Sonuçlar `root.after` ile ana döngüye aktarılır; aynı
+    anahtarla gönderilen yeni bir istek, henüz tamamlanmamış eskisini geçersiz
+    kılar.
+    """
+
+    POLL_INTERVAL_MS = 25
+
+    def __init__(self, root, factory, on_busy_change=None):
+        self.root = root
+        self.on_busy_change = on_busy_change
+        self._factory = factory
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}
+        self._counter = 0
+        self._pending = 0
+        self._polling = False
+        self._thread = threading.Thread(target=self._run, name="finance-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, key, func, callback=None, error_callback=None):
+        """`func(finance_manager)` işini kuyruğa ekler; sonucu `callback` ile ana döngüde döndürür."""
+        self._counter += 1
+        token = self._counter
+        self._latest[key] = token
+        self._pending += 1
+        if self._pending == 1 and self.on_busy_change:
+            self.on_busy_change(True)
+        self._tasks.put((key, token, func, callback, error_callback))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        return token
+
+    def is_current(self, key, token):
+        return self._latest.get(key) == token
+
+    def shutdown(self, timeout=2.0):
+        self._tasks.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        manager = None
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+            key, token, func, callback, error_callback = task
+            # Yerine yenisi gelmiş istekler hiç çalıştırılmaz
+            if not self.is_current(key, token):
+                self._results.put((key, token, None, None, None, None))
+                continue
+            try:
+                if manager is None:
+                    manager = self._factory()
+                result, error = func(manager), None
+            except Exception as e:
+                logging.exception("Arka plan işi başarısız: %s", key)
+                result, error = None, e
+            self._results.put((key, token, result, error, callback, error_callback))
+        if manager is not None:
+            manager.db.close()
+
+    def _poll(self):
+        while True:
+            try:
+                key, token, result, error, callback, error_callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if not self.is_current(key, token):
+                continue
+            if error is not None:
+                if error_callback:
+                    error_callback(error)
+            elif callback:
+                callback(result)
+        if self._pending:
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+            if self.on_busy_change:
+                self.on_busy_change(False)